@@ -1,12 +1,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from typing import Any, Callable
 
-from adaad6.assurance.logging import build_log_event, compute_checksum
+from adaad6.assurance.logging import build_log_event, compute_checksum, utc_now_iso_z
 from adaad6.config import AdaadConfig
-from adaad6.provenance.ledger import append_event
+from adaad6.provenance.ledger import LedgerBatchWriter, append_event
 
 
 def idempotency_key(intent: str, inputs: dict[str, Any]) -> str:
@@ -27,9 +26,35 @@ class BaseAdapter:
     def _execute(self, intent: str, inputs: dict[str, Any], cfg: AdaadConfig) -> dict[str, Any]:
         raise NotImplementedError("Subclasses must implement _execute")
 
-    @staticmethod
-    def _utc_now_iso_z() -> str:
-        return datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
+    _utc_now_iso_z = staticmethod(utc_now_iso_z)
+
+    def _ledger_writer(self, cfg: AdaadConfig) -> LedgerBatchWriter:
+        writer: LedgerBatchWriter | None = getattr(self, "_batch_writer", None)
+        if writer is not None and writer.cfg is cfg:
+            return writer
+        if writer is not None:
+            writer.flush()
+        writer = LedgerBatchWriter(cfg)
+        self._batch_writer = writer
+        return writer
+
+    def flush_ledger(self) -> list[dict[str, Any]]:
+        """Write any adapter_call events still buffered by ledger batching."""
+        writer: LedgerBatchWriter | None = getattr(self, "_batch_writer", None)
+        return writer.flush() if writer is not None else []
+
+    def close(self) -> None:
+        """Flush buffered ledger events and drop the batch writer."""
+        writer: LedgerBatchWriter | None = getattr(self, "_batch_writer", None)
+        if writer is not None:
+            writer.flush()
+            self._batch_writer = None
+
+    def __enter__(self) -> "BaseAdapter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     def run(
         self,
@@ -39,7 +64,7 @@ class BaseAdapter:
         cfg: AdaadConfig,
         now_fn: Callable[[], str] | None = None,
     ) -> AdapterResult:
-        cfg.validate()
+        cfg.validate_once()
         timestamp_fn = now_fn or self._utc_now_iso_z
         outputs = self._execute(intent=intent, inputs=inputs, cfg=cfg)
         ts = timestamp_fn()
@@ -56,8 +81,26 @@ class BaseAdapter:
         ledger_appended = False
         ledger_event_hash: str | None = None
         ledger_error: str | None = None
+        ledger_pending: bool | None = None
 
-        if cfg.ledger_enabled:
+        if cfg.ledger_enabled and cfg.ledger_batch_size > 1:
+            # Batched: the event is written once the batch fills or ages out (see flush_ledger).
+            try:
+                written = self._ledger_writer(cfg).enqueue(
+                    "adapter_call",
+                    log_base,
+                    ts,
+                    actor,
+                    payload_canonical=log_event.canonical_bytes(),
+                )
+                ledger_appended = bool(written)
+                ledger_pending = not written
+                if written:
+                    hash_value = written[-1].get("hash")
+                    ledger_event_hash = hash_value if isinstance(hash_value, str) else None
+            except Exception as exc:  # pragma: no cover - defensive
+                ledger_error = str(exc)
+        elif cfg.ledger_enabled:
             try:
                 event = append_event(
                     cfg=cfg,
@@ -65,6 +108,7 @@ class BaseAdapter:
                     payload=log_base,
                     ts=ts,
                     actor=actor,
+                    payload_canonical=log_event.canonical_bytes(),
                 )
                 ledger_appended = True
                 hash_value = event.get("hash")
@@ -73,11 +117,14 @@ class BaseAdapter:
                 ledger_appended = False
                 ledger_error = str(exc)
 
-        log_dict = log_base | {
+        log_dict = {
+            **log_base,
             "ledger_appended": ledger_appended,
             "ledger_error": ledger_error,
             "ledger_event_hash": ledger_event_hash,
         }
+        if ledger_pending is not None:
+            log_dict["ledger_pending"] = ledger_pending
 
         return AdapterResult(ok=True, output=outputs, log=log_dict)
 
@@ -1,19 +1,26 @@
 from __future__ import annotations
 
-import ast
-import importlib.util
-import subprocess
+import os
+import re
 import sys
-from datetime import datetime, timezone
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Iterable
-from uuid import uuid4
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
 
+from adaad6.assurance.logging import utc_now_iso_z
 from adaad6.config import AdaadConfig, ResourceTier, load_config
 from adaad6.provenance.ledger import append_event, ensure_ledger
-from adaad6.runtime.health import check_structure_details
+
+if TYPE_CHECKING:
+    import ast
+
+# ast, subprocess, importlib.util, uuid and runtime.health are imported where used so
+# that importing this module stays cheap for CLI commands that never run the doctor.
 
 FORBIDDEN_MODULES = {"socket"}
+# below this many files, process-pool start-up costs more than it saves
+_PARALLEL_SCAN_MIN_FILES = 32
 
 
 def _check_config(config: AdaadConfig) -> dict[str, Any]:
@@ -25,15 +32,18 @@ def _check_config(config: AdaadConfig) -> dict[str, Any]:
 
 
 def _check_structure(config: AdaadConfig, *, details: dict[str, Any] | None = None) -> dict[str, Any]:
-    details = details or check_structure_details(cfg=config)
-    details_sorted = dict(sorted(details.items()))
+    if not details:
+        from adaad6.runtime.health import check_structure_details
+
+        details = check_structure_details(cfg=config)
     ok = (
         bool(details.get("structure"))
         and bool(details.get("ledger_dirs"))
         and bool(details.get("ledger_feed", True))
         and bool(details.get("telemetry_ok", True))
     )
-    return {"ok": ok, "details": details_sorted}
+    # check_structure_details returns its keys in sorted order
+    return {"ok": ok, "details": details}
 
 
 def _check_ledger(config: AdaadConfig, *, details: dict[str, Any] | None = None) -> dict[str, Any]:
@@ -44,6 +54,9 @@ def _check_ledger(config: AdaadConfig, *, details: dict[str, Any] | None = None)
             return {"ok": False, "error": details.get("ledger_dirs_error"), "path": details.get("ledger_feed_path")}
         if not details.get("ledger_feed", True):
             return {"ok": False, "error": details.get("ledger_feed_error"), "path": details.get("ledger_feed_path")}
+        if details.get("ledger_dirs") and details.get("ledger_feed") and details.get("ledger_feed_path"):
+            # the structure check already probed these paths; append_event creates them on write
+            return {"ok": True, "path": details["ledger_feed_path"]}
     try:
         path = ensure_ledger(config)
         return {"ok": True, "path": str(path)}
@@ -60,20 +73,21 @@ def _tail_lines(raw: str | None, *, limit: int = 10) -> list[str]:
     return lines[-limit:]
 
 
-def _utc_now_iso_z() -> str:
-    return datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
-
-
 def _run_pytest_check(config: AdaadConfig) -> dict[str, Any]:
     if config.resource_tier == ResourceTier.MOBILE:
         return {"ok": True, "skipped": True, "reason": "resource_tier=mobile"}
 
+    import importlib.util
+    import subprocess
+
     if importlib.util.find_spec("pytest") is None:
         return {"ok": True, "skipped": True, "reason": "pytest not installed"}
 
-    cmd = [sys.executable, "-m", "pytest"]
+    cmd = [sys.executable, "-m", "pytest", "-q", "--no-header", "-p", "no:cacheprovider"]
+    # Entry-point plugin discovery dominates pytest start-up; the suite does not rely on it.
+    env = dict(os.environ, PYTEST_DISABLE_PLUGIN_AUTOLOAD="1", PYTHONDONTWRITEBYTECODE="1")
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        result = subprocess.run(cmd, capture_output=True, text=True, check=False, env=env)
     except Exception as exc:
         return {"ok": False, "error": str(exc), "command": cmd}
 
@@ -89,6 +103,8 @@ def _run_pytest_check(config: AdaadConfig) -> dict[str, Any]:
 
 
 def _iter_imports(tree: ast.AST) -> Iterable[str]:
+    import ast
+
     for node in ast.walk(tree):
         if isinstance(node, ast.Import):
             for alias in node.names:
@@ -98,40 +114,131 @@ def _iter_imports(tree: ast.AST) -> Iterable[str]:
                 yield node.module.split(".")[0]
 
 
-def _scan_forbidden_modules(root: Path, forbidden: set[str]) -> tuple[list[dict[str, str]], list[str], list[dict[str, str]]]:
+def _iter_python_files(directory: str, parts: tuple[str, ...] = ()) -> Iterator[tuple[os.DirEntry[str], tuple[str, ...]]]:
+    """
+    Yield (entry, relative parts) for every *.py entry under directory, in the same
+    order as sorted(rglob("*.py"), key=as_posix), with one scandir per directory.
+    Symlinked directories are not descended, matching rglob.
+    """
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except PermissionError:
+        return
+    keyed = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir(follow_symlinks=False)
+        except OSError:
+            is_dir = False
+        # sorting siblings by "name/" for directories reproduces a sort of full paths
+        keyed.append((entry.name + "/" if is_dir else entry.name, entry, is_dir))
+    keyed.sort(key=itemgetter(0))
+    for _, entry, is_dir in keyed:
+        rel_parts = parts + (entry.name,)
+        if entry.name.endswith(".py"):
+            yield entry, rel_parts
+        if is_dir:
+            yield from _iter_python_files(entry.path, rel_parts)
+
+
+def _is_same_file(entry: os.DirEntry[str], target: os.stat_result) -> bool:
+    try:
+        st = entry.stat()
+    except OSError:
+        return False
+    return st.st_ino == target.st_ino and st.st_dev == target.st_dev
+
+
+@lru_cache(maxsize=4)
+def _forbidden_pattern(forbidden: frozenset[str]) -> re.Pattern[bytes]:
+    names = b"|".join(re.escape(module.encode("utf-8")) for module in sorted(forbidden))
+    return re.compile(rb"\b(" + names + rb")\b")
+
+
+def _scan_file(path: str, rel_path: str, forbidden: frozenset[str]) -> tuple[list[dict[str, str]], dict[str, str] | None]:
+    # Module-level so it can run in a worker process.
+    import ast
+
+    try:
+        source = Path(path).read_bytes()
+    except Exception as exc:
+        return [], {"path": rel_path, "error": str(exc)}
+    # one pass over the raw bytes finds every forbidden name that could be imported
+    candidates = {match.decode("utf-8") for match in _forbidden_pattern(forbidden).findall(source)}
+    try:
+        tree = ast.parse(source)
+    except Exception as exc:
+        matched = sorted(
+            {
+                module
+                for module in candidates
+                if f"import {module}".encode("utf-8") in source or f"from {module}".encode("utf-8") in source
+            }
+        )
+        return [{"path": rel_path, "module": module} for module in matched or ["unknown"]], {
+            "path": rel_path,
+            "error": str(exc),
+        }
+    if not candidates:
+        # an import of a module always contains its name, so there is nothing to walk for
+        return [], None
+    modules = set(module for module in _iter_imports(tree) if module in candidates)
+    return [{"path": rel_path, "module": module} for module in sorted(modules)], None
+
+
+def _scan_files(
+    jobs: list[tuple[str, str]], forbidden: frozenset[str], *, parallel: bool
+) -> list[tuple[list[dict[str, str]], dict[str, str] | None]]:
+    if parallel and len(jobs) > _PARALLEL_SCAN_MIN_FILES and (os.cpu_count() or 1) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        from concurrent.futures.process import BrokenProcessPool
+
+        workers = os.cpu_count() or 1
+        paths = [path for path, _ in jobs]
+        rel_paths = [rel_path for _, rel_path in jobs]
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                return list(
+                    pool.map(
+                        _scan_file,
+                        paths,
+                        rel_paths,
+                        [forbidden] * len(jobs),
+                        chunksize=max(1, len(jobs) // (workers * 4)),
+                    )
+                )
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            pass  # no usable process pool here; scan in-process instead
+    return [_scan_file(path, rel_path, forbidden) for path, rel_path in jobs]
+
+
+def _scan_forbidden_modules(
+    root: Path, forbidden: set[str], *, parallel: bool = False
+) -> tuple[list[dict[str, str]], list[str], list[dict[str, str]]]:
     hits: list[dict[str, str]] = []
     scanned: list[str] = []
     errors: list[dict[str, str]] = []
-    doctor_path = Path(__file__).resolve()
-    for path in sorted(root.rglob("*.py"), key=lambda p: p.as_posix()):
-        if path.resolve() == doctor_path:
+    doctor_stat = os.stat(__file__)
+    jobs: list[tuple[str, str]] = []
+    for entry, parts in _iter_python_files(str(root)):
+        if _is_same_file(entry, doctor_stat):
             continue
-        scanned.append(path.relative_to(root).as_posix())
-        try:
-            source = path.read_text(encoding="utf-8")
-        except Exception as exc:
-            errors.append({"path": str(path.relative_to(root)), "error": str(exc)})
-            continue
-        try:
-            tree = ast.parse(source)
-        except Exception as exc:
-            errors.append({"path": str(path.relative_to(root)), "error": str(exc)})
-            matched = sorted(
-                {module for module in forbidden if f"import {module}" in source or f"from {module}" in source}
-            )
-            for module in matched or ["unknown"]:
-                hits.append({"path": str(path.relative_to(root)), "module": module})
-            continue
-        modules = set(module for module in _iter_imports(tree) if module in forbidden)
-        for module in sorted(modules):
-            hits.append({"path": str(path.relative_to(root)), "module": module})
+        scanned.append("/".join(parts))
+        jobs.append((entry.path, os.sep.join(parts)))
+    for file_hits, error in _scan_files(jobs, frozenset(forbidden), parallel=parallel):
+        if error is not None:
+            errors.append(error)
+        hits.extend(file_hits)
     return hits, scanned, errors
 
 
 def _check_static_scan(config: AdaadConfig, *, root: Path | None = None) -> dict[str, Any]:
     scan_root = root or Path(__file__).resolve().parent.parent
     root_value = str(scan_root)
-    forbidden, scanned, errors = _scan_forbidden_modules(scan_root, FORBIDDEN_MODULES)
+    forbidden, scanned, errors = _scan_forbidden_modules(
+        scan_root, FORBIDDEN_MODULES, parallel=config.resource_tier != ResourceTier.MOBILE
+    )
     return {
         "ok": not forbidden,
         "tier": config.resource_tier.value,
@@ -143,19 +250,22 @@ def _check_static_scan(config: AdaadConfig, *, root: Path | None = None) -> dict
 
 
 def run_doctor(cfg: AdaadConfig | None = None, *, scan_root: Path | None = None) -> dict[str, Any]:
+    from uuid import uuid4
+
+    from adaad6.runtime.health import check_structure_details
+
     config = cfg or load_config()
     run_id = uuid4().hex
 
     health_details = check_structure_details(cfg=config)
-    checks = {
+    # literal keys are in sorted order, which is the report's deterministic order
+    ordered_checks = {
         "config": _check_config(config),
         "health": _check_structure(config, details=health_details),
         "ledger": _check_ledger(config, details=health_details),
         "pytest": _run_pytest_check(config),
         "static_scan": _check_static_scan(config, root=scan_root),
     }
-
-    ordered_checks = dict(sorted(checks.items()))
     ok = all(check.get("ok", False) for check in ordered_checks.values())
     checks_summary = {
         name: {"ok": bool(check.get("ok", False)), "skipped": bool(check.get("skipped", False))}
@@ -178,7 +288,7 @@ def run_doctor(cfg: AdaadConfig | None = None, *, scan_root: Path | None = None)
                     "resource_tier": config.resource_tier.value,
                     "checks_summary": checks_summary,
                 },
-                ts=_utc_now_iso_z(),
+                ts=utc_now_iso_z(),
                 actor="doctor",
             )
             ledger_appended = True
@@ -1,24 +1,85 @@
 from __future__ import annotations
 
+import atexit
 import hashlib
 import json
 import os
-from dataclasses import dataclass
-from datetime import datetime, timezone
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from json.encoder import encode_basestring_ascii
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Mapping
 
 from adaad6.config import AdaadConfig
 
+try:  # optional accelerator, see parse_json
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on environment
+    _orjson = None
+
+# Shared encoder: json.dumps(...) builds a fresh JSONEncoder on every call.
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"))
+
+
+def canonical_json_bytes(obj: Any) -> bytes:
+    """Canonical JSON as UTF-8 bytes."""
+    return _CANONICAL_ENCODER.encode(obj).encode("utf-8")
+
+
+def canonical_json_line(obj: Any) -> bytes:
+    """canonical_json_bytes(obj) + b"\\n", encoded in one pass."""
+    return (_CANONICAL_ENCODER.encode(obj) + "\n").encode("utf-8")
+
 
 def canonical_json(obj: Any) -> str:
-    return json.dumps(obj, sort_keys=True, separators=(",", ":"))
+    return canonical_json_bytes(obj).decode("utf-8")
+
+
+# orjson parses integers beyond 64 bits as floats; leave any long digit run to the stdlib.
+_LONG_DIGIT_RUN = re.compile(r"[0-9]{19}")
+_LONG_DIGIT_RUN_BYTES = re.compile(rb"[0-9]{19}")
+
+
+def parse_json(raw: str | bytes) -> Any:
+    """
+    json.loads with orjson as an accelerator when installed. Anything orjson rejects
+    (NaN, out-of-range numbers, lone surrogates) is re-parsed by the stdlib, so
+    accepted inputs, results and json.JSONDecodeError errors match json.loads.
+    UTF-8 bytes are parsed as-is, without decoding to str first.
+    """
+    long_digits = _LONG_DIGIT_RUN_BYTES if isinstance(raw, bytes) else _LONG_DIGIT_RUN
+    if _orjson is not None and long_digits.search(raw) is None:
+        try:
+            return _orjson.loads(raw)
+        except ValueError:
+            pass
+    return json.loads(raw)
+
+
+def canonical_json_splice(fields: Mapping[str, Any], encoded: Mapping[str, bytes]) -> bytes:
+    """
+    Canonical JSON bytes for ``{**fields, **encoded}`` where ``encoded`` values are
+    already canonical JSON bytes. Output is identical to canonical_json of the merged
+    dict, without re-serializing the pre-encoded values.
+    """
+    parts = []
+    for key in sorted({**fields, **encoded}):
+        value = encoded[key] if key in encoded else canonical_json_bytes(fields[key])
+        parts.append(encode_basestring_ascii(key).encode("utf-8") + b":" + value)
+    return b"{" + b",".join(parts) + b"}"
+
+
+def compute_checksum_bytes(encoded: bytes) -> str:
+    # log checksums are integrity markers, not a security boundary (see hashchain for the ledger)
+    return hashlib.sha256(encoded, usedforsecurity=False).hexdigest()
 
 
 def compute_checksum(payload: Any) -> str:
-    encoded_payload = payload if isinstance(payload, str) else canonical_json(payload)
-    encoded = encoded_payload.encode("utf-8")
-    return hashlib.sha256(encoded).hexdigest()
+    if isinstance(payload, str):
+        return compute_checksum_bytes(payload.encode("utf-8"))
+    return compute_checksum_bytes(canonical_json_bytes(payload))
 
 
 @dataclass(frozen=True)
@@ -30,17 +91,30 @@ class LogEvent:
     inputs: dict[str, Any]
     outputs: dict[str, Any]
     checksum: str
+    # canonical JSON bytes of to_dict(), cached by build_log_event for downstream appends
+    canonical: bytes = field(default=b"", repr=False, compare=False)
+    _dict: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
+
+    def canonical_bytes(self) -> bytes:
+        return self.canonical or canonical_json_bytes(self.to_dict())
 
     def to_dict(self) -> dict[str, Any]:
-        return {
-            "schema_version": self.schema_version,
-            "ts": self.ts,
-            "actor": self.actor,
-            "intent": self.intent,
-            "inputs": self.inputs,
-            "outputs": self.outputs,
-            "checksum": self.checksum,
-        }
+        # Built once per event and shared between calls; copy before mutating.
+        if self._dict is None:
+            object.__setattr__(
+                self,
+                "_dict",
+                {
+                    "schema_version": self.schema_version,
+                    "ts": self.ts,
+                    "actor": self.actor,
+                    "intent": self.intent,
+                    "inputs": self.inputs,
+                    "outputs": self.outputs,
+                    "checksum": self.checksum,
+                },
+            )
+        return self._dict
 
 
 def build_log_event(
@@ -52,16 +126,18 @@ def build_log_event(
     outputs: dict[str, Any],
     checksum_fn: Callable[[dict[str, Any]], str] | None = None,
 ) -> LogEvent:
-    payload = {
+    header = {
         "schema_version": schema_version,
         "ts": ts,
         "actor": actor,
         "intent": intent,
-        "inputs": inputs,
-        "outputs": outputs,
     }
-    checksum_function = checksum_fn or compute_checksum
-    checksum = checksum_function(payload)
+    # inputs/outputs dominate the payload size; encode them once for checksum and cache
+    encoded = {"inputs": canonical_json_bytes(inputs), "outputs": canonical_json_bytes(outputs)}
+    if checksum_fn is None:
+        checksum = compute_checksum_bytes(canonical_json_splice(header, encoded))
+    else:
+        checksum = checksum_fn({**header, "inputs": inputs, "outputs": outputs})
     return LogEvent(
         schema_version=schema_version,
         ts=ts,
@@ -70,11 +146,126 @@ def build_log_event(
         inputs=inputs,
         outputs=outputs,
         checksum=checksum,
+        canonical=canonical_json_splice({**header, "checksum": checksum}, encoded),
     )
 
 
-def _utc_now_iso_z() -> str:
-    return datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
+def utc_now_iso_z() -> str:
+    # Same output as datetime.now(timezone.utc).isoformat(timespec="seconds") with a Z suffix,
+    # without allocating datetime/tzinfo objects.
+    return "%04d-%02d-%02dT%02d:%02d:%02dZ" % time.gmtime()[:6]
+
+
+_APPEND_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_CLOEXEC", 0)
+
+
+def append_bytes(path: Path, data: bytes) -> None:
+    """
+    Append data to path. On POSIX this is a single write(2) on an O_APPEND
+    descriptor, so each record lands whole even with concurrent appenders;
+    elsewhere it falls back to a buffered binary append. A POSIX failure after
+    some bytes were written raises PartialAppendError.
+    """
+    if os.name != "posix":
+        with path.open("ab") as handle:
+            handle.write(data)
+        return
+    fd = os.open(path, _APPEND_FLAGS, 0o666)
+    try:
+        _write_all(fd, data)
+    finally:
+        os.close(fd)
+
+
+class PartialAppendError(OSError):
+    """A POSIX append failed after the first ``written`` bytes of the data reached the file."""
+
+    def __init__(self, written: int, cause: OSError) -> None:
+        super().__init__(cause.errno, cause.strerror)
+        self.written = written
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    written = 0
+    while view:
+        try:
+            count = os.write(fd, view)
+        except OSError as exc:
+            if written:
+                raise PartialAppendError(written, exc) from exc
+            raise
+        written += count
+        view = view[count:]
+
+
+# JSONL log descriptors kept open across appends: path -> (fd, st_dev, st_ino).
+# _LOG_FDS_LOCK is held from lookup through the write, so eviction or a rotation
+# reopen in another thread cannot close (and let the OS reuse) a descriptor that
+# is still being written to.
+_LOG_FDS: dict[str, tuple[int, int, int]] = {}
+_LOG_FDS_LOCK = threading.Lock()
+_LOG_FDS_MAX = 8
+
+
+def _append_cached(target: Path, data: bytes) -> None:
+    key = str(target)
+    with _LOG_FDS_LOCK:
+        fd = _cached_log_fd(key)
+        if fd is None:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            if target.is_dir():
+                raise RuntimeError(f"Log path {target} is a directory, expected a file")
+            fd = _open_log_fd(key)
+        _write_all(fd, data)
+
+
+def _cached_log_fd(key: str) -> int | None:
+    # caller holds _LOG_FDS_LOCK
+    cached = _LOG_FDS.get(key)
+    if cached is None:
+        return None
+    fd, dev, ino = cached
+    try:
+        st = os.stat(key)
+    except OSError:
+        st = None
+    if st is not None and st.st_dev == dev and st.st_ino == ino:
+        return fd
+    # rotated or removed underneath us: reopen so lines land in the file at path
+    del _LOG_FDS[key]
+    os.close(fd)
+    return None
+
+
+def _open_log_fd(key: str) -> int:
+    # caller holds _LOG_FDS_LOCK
+    fd = os.open(key, _APPEND_FLAGS, 0o666)
+    st = os.fstat(fd)
+    if len(_LOG_FDS) >= _LOG_FDS_MAX:
+        oldest = next(iter(_LOG_FDS))
+        os.close(_LOG_FDS.pop(oldest)[0])
+    _LOG_FDS[key] = (fd, st.st_dev, st.st_ino)
+    return fd
+
+
+@atexit.register
+def _close_log_fds() -> None:
+    with _LOG_FDS_LOCK:
+        while _LOG_FDS:
+            os.close(_LOG_FDS.popitem()[1][0])
+
+
+def flush_log(path: Path | None = None) -> None:
+    """fsync the cached JSONL log descriptor for path (all of them when omitted)."""
+    with _LOG_FDS_LOCK:
+        if path is None:
+            entries = list(_LOG_FDS.values())
+        else:
+            cached = _LOG_FDS.get(str(path))
+            entries = [cached] if cached is not None else []
+        for fd, _, _ in entries:
+            os.fsync(fd)
 
 
 def log_path(cfg: AdaadConfig) -> Path:
@@ -96,30 +287,51 @@ def append_jsonl_log_event(
     details: dict[str, Any] | None = None,
     ts: str | None = None,
     path: Path | None = None,
+    details_canonical: bytes | None = None,
 ) -> dict[str, Any]:
-    event_without_checksum = {
+    """
+    details_canonical, when given, must be canonical_json(details) as UTF-8 bytes; it
+    is spliced into both the checksum input and the written line instead of
+    re-serializing details twice.
+    """
+    header = {
         "schema_version": cfg.log_schema_version,
-        "ts": ts or _utc_now_iso_z(),
+        "ts": ts or utc_now_iso_z(),
         "action": action,
         "outcome": outcome,
-        "details": details or {},
     }
-    event = dict(event_without_checksum, checksum=compute_checksum(event_without_checksum))
-    serialized = canonical_json(event)
+    details = details or {}
+    encoded = {"details": details_canonical or canonical_json_bytes(details)}
+    checksum = compute_checksum_bytes(canonical_json_splice(header, encoded))
+    event = dict(header, details=details, checksum=checksum)
+    serialized = canonical_json_splice({**header, "checksum": checksum}, encoded)
     target = path or log_path(cfg)
+    line = serialized + b"\n"
+    if os.name == "posix":
+        # The descriptor stays open between appends; O_APPEND keeps each line whole.
+        _append_cached(target, line)
+        return event
     target.parent.mkdir(parents=True, exist_ok=True)
     if target.exists() and target.is_dir():
         raise RuntimeError(f"Log path {target} is a directory, expected a file")
-    with target.open("a", encoding="utf-8") as handle:
-        handle.write(serialized + "\n")
+    append_bytes(target, line)
     return event
 
 
 __all__ = [
     "LogEvent",
+    "PartialAppendError",
+    "append_bytes",
     "canonical_json",
+    "canonical_json_bytes",
+    "canonical_json_line",
+    "canonical_json_splice",
     "compute_checksum",
+    "compute_checksum_bytes",
     "build_log_event",
+    "flush_log",
     "append_jsonl_log_event",
     "log_path",
+    "parse_json",
+    "utc_now_iso_z",
 ]
@@ -3,30 +3,57 @@ from __future__ import annotations
 import argparse
 import json
 import sys
-from typing import Any
+from functools import lru_cache
+from typing import Any, Callable, Iterable
 
 
-def _dump(obj: Any) -> str:
+def _dump(obj: Any) -> bytes:
     # Late import so `adaad6 --help` does not fail if optional modules are missing.
-    from adaad6.assurance.logging import canonical_json
+    from adaad6.assurance.logging import canonical_json_line
 
-    return canonical_json(obj)
+    # one canonical JSON line, newline included
+    return canonical_json_line(obj)
+
+
+def _write_stdout(data: bytes) -> None:
+    # All CLI stdout goes through here as bytes, so the text layer never holds pending
+    # output and sys.stdout.buffer can be written directly. main() flushes the text
+    # layer before the command runs and the whole stream once on exit.
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        # Text-only streams (e.g. redirected to StringIO in tests).
+        sys.stdout.write(data.decode("utf-8"))
+        return
+    buffer.write(data)
+
+
+def _write_stdout_lines(lines: Iterable[bytes]) -> None:
+    # Records share the stream's block buffer instead of a flush (and write syscall)
+    # per record on line-buffered stdout.
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.writelines(line.decode("utf-8") for line in lines)
+    else:
+        buffer.writelines(lines)
 
 
 def _emit(obj: Any) -> None:
-    sys.stdout.write(_dump(obj) + "\n")
-    sys.stdout.flush()
+    _write_stdout(_dump(obj))
 
 
 def _emit_stderr(text: str) -> None:
-    # Human output should not break machine pipelines.
+    # Human output should not break machine pipelines; flush stdout first so a
+    # shared terminal shows the machine output before it.
+    sys.stdout.flush()
     sys.stderr.write(text.rstrip("\n") + "\n")
     sys.stderr.flush()
 
 
-def _parse_json_object(raw: str) -> dict[str, Any]:
+def _parse_json_object(raw: str | bytes) -> dict[str, Any]:
+    from adaad6.assurance.logging import parse_json
+
     try:
-        parsed = json.loads(raw)
+        parsed = parse_json(raw)
     except json.JSONDecodeError as exc:
         raise ValueError(f"--inputs must be valid JSON object: {exc}") from exc
     if not isinstance(parsed, dict):
@@ -34,11 +61,20 @@ def _parse_json_object(raw: str) -> dict[str, Any]:
     return parsed
 
 
+_logging_module: Any = None
+
+
 def _safe_cli_log(cfg: Any, *, action: str, outcome: str, details: dict[str, Any]) -> None:
+    if not getattr(cfg, "cli_logging_enabled", True) or not getattr(cfg, "log_path", None):
+        return
+    global _logging_module
     try:
-        from adaad6.assurance.logging import append_jsonl_log_event
+        if _logging_module is None:
+            import adaad6.assurance.logging as logging_module
 
-        append_jsonl_log_event(cfg=cfg, action=action, outcome=outcome, details=details)
+            _logging_module = logging_module
+        # attribute lookup per call so the function can still be patched
+        _logging_module.append_jsonl_log_event(cfg=cfg, action=action, outcome=outcome, details=details)
     except Exception:  # pragma: no cover - defensive best-effort logging
         # CLI success/failure must not depend on logging availability.
         pass
@@ -67,20 +103,37 @@ def _doctor_human_summary(report: dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
+@lru_cache(maxsize=1)
+def _cli_echo_adapter_cls() -> type:
+    # Late import to avoid tight coupling between CLI import and adapter internals;
+    # the subclass is created once rather than on every run.
+    from adaad6.adapters.base import BaseAdapter
+
+    class _CliEchoAdapter(BaseAdapter):
+        name = "cli_echo"
+
+        def _execute(self, intent: str, inputs: dict[str, Any], cfg: Any) -> dict[str, Any]:
+            return {"intent": intent, "inputs": inputs}
+
+    return _CliEchoAdapter
+
+
 class _EchoAdapter:
     name = "cli_echo"
 
     def run(self, intent: str, inputs: dict[str, Any], actor: str, cfg: Any):
-        # Late import to avoid tight coupling between CLI import and adapter internals.
-        from adaad6.adapters.base import BaseAdapter
-
-        class _Wrapped(BaseAdapter):
-            name = "cli_echo"
+        # One adapter per run; closing it writes an adapter_call event still held by
+        # ledger batching (ledger_batch_size > 1) before the command returns.
+        with _cli_echo_adapter_cls()() as adapter:
+            return adapter.run(intent=intent, inputs=inputs, actor=actor, cfg=cfg)
 
-            def _execute(self, intent: str, inputs: dict[str, Any], cfg: Any) -> dict[str, Any]:
-                return {"intent": intent, "inputs": inputs}
 
-        return _Wrapped().run(intent=intent, inputs=inputs, actor=actor, cfg=cfg)
+def _add_report_path_arg(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--report-path",
+        default="doctor_report.txt",
+        help="Path to use in the generated report template destination",
+    )
 
 
 def _add_doctor_run_args(parser: argparse.ArgumentParser) -> None:
@@ -102,232 +155,316 @@ def _add_doctor_run_args(parser: argparse.ArgumentParser) -> None:
     )
 
 
-def _build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(prog="adaad6", description="ADAAD-6 deterministic CLI")
-    sub = parser.add_subparsers(dest="command", required=True)
+def _populate_doctor(parser: argparse.ArgumentParser) -> None:
+    _add_report_path_arg(parser)
+    _add_doctor_run_args(parser)
+    doctor_sub = parser.add_subparsers(dest="doctor_command", required=False)
 
-    doctor_common = argparse.ArgumentParser(add_help=False)
-    doctor_common.add_argument(
-        "--report-path",
-        default="doctor_report.txt",
-        help="Path to use in the generated report template destination",
-    )
+    doctor_run = doctor_sub.add_parser("run", help="Perform combined diagnostics")
+    _add_report_path_arg(doctor_run)
+    _add_doctor_run_args(doctor_run)
 
-    sub.add_parser("boot", help="Run boot sequence checks")
-    sub.add_parser("health", help="Run structural health checks")
-    doctor_parser = sub.add_parser("doctor", help="Doctor utilities", parents=[doctor_common])
-    _add_doctor_run_args(doctor_parser)
-    doctor_sub = doctor_parser.add_subparsers(dest="doctor_command", required=False)
+    doctor_tpl = doctor_sub.add_parser("template", help="Emit the doctor planning template JSON without running doctor")
+    _add_report_path_arg(doctor_tpl)
 
-    doctor_run = doctor_sub.add_parser("run", help="Perform combined diagnostics", parents=[doctor_common])
-    _add_doctor_run_args(doctor_run)
 
-    doctor_tpl = doctor_sub.add_parser(
-        "template", help="Emit the doctor planning template JSON without running doctor", parents=[doctor_common]
-    )
-    sub.add_parser("version", help="Show ADAAD-6 version information")
+def _populate_plan(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("goal", help="Goal to plan for")
 
-    plan_parser = sub.add_parser("plan", help="Generate a plan for a goal")
-    plan_parser.add_argument("goal", help="Goal to plan for")
 
-    template_parser = sub.add_parser("template", help="Emit a planning template JSON")
-    template_parser.add_argument(
+def _populate_template(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
         "name",
         choices=("doctor_report", "diff_report", "scaffold"),
         help="Template name to render",
     )
-    template_parser.add_argument(
+    parser.add_argument(
         "--destination",
         default=None,
         help="Optional destination override written into the template metadata",
     )
-    template_parser.add_argument(
+    parser.add_argument(
         "--base-ref",
         default="HEAD",
         help="Base git ref for diff_report templates",
     )
 
-    run_parser = sub.add_parser("run", help="Execute a deterministic adapter call")
-    run_parser.add_argument("--intent", default="noop", help="Intent name for the adapter call")
-    run_parser.add_argument("--inputs", default="{}", help="JSON object of inputs for the adapter call")
-    run_parser.add_argument("--actor", default="cli", help="Actor identifier for audit logs")
 
-    ledger_parser = sub.add_parser("ledger", help="Ledger operations")
-    ledger_sub = ledger_parser.add_subparsers(dest="ledger_command", required=True)
+def _populate_run(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--intent", default="noop", help="Intent name for the adapter call")
+    parser.add_argument("--inputs", default="{}", help="JSON object of inputs for the adapter call")
+    parser.add_argument("--actor", default="cli", help="Actor identifier for audit logs")
+
+
+def _populate_ledger(parser: argparse.ArgumentParser) -> None:
+    # `verify` takes no --limit; the default keeps args.limit present for every ledger command
+    parser.set_defaults(limit=None)
+    ledger_sub = parser.add_subparsers(dest="ledger_command", required=True)
     tail_parser = ledger_sub.add_parser("tail", help="Tail ledger events")
     tail_parser.add_argument("--limit", type=int, default=None, help="Maximum number of events to read from the end")
     ledger_sub.add_parser("verify", help="Verify ledger hashchain integrity")
 
+
+# Subcommand name -> (help, argument builder), in `adaad6 --help` order.
+_SUBCOMMANDS: dict[str, tuple[str, Callable[[argparse.ArgumentParser], None] | None]] = {
+    "boot": ("Run boot sequence checks", None),
+    "health": ("Run structural health checks", None),
+    "doctor": ("Doctor utilities", _populate_doctor),
+    "version": ("Show ADAAD-6 version information", None),
+    "plan": ("Generate a plan for a goal", _populate_plan),
+    "template": ("Emit a planning template JSON", _populate_template),
+    "run": ("Execute a deterministic adapter call", _populate_run),
+    "ledger": ("Ledger operations", _populate_ledger),
+}
+
+
+def _selected_command(argv: list[str]) -> str | None:
+    # The top-level parser takes no options besides -h, so the first bare token is the subcommand.
+    for token in argv:
+        if not token.startswith("-"):
+            return token if token in _SUBCOMMANDS else None
+    return None
+
+
+@lru_cache(maxsize=len(_SUBCOMMANDS) + 1)
+def _build_parser(command: str | None = None) -> argparse.ArgumentParser:
+    """
+    Build the CLI parser with every subcommand registered but only ``command``'s
+    arguments added: argparse only ever parses the selected subparser, so the others
+    can stay empty. Cached per command: parse_args only reads the parser and builds a
+    fresh Namespace, so repeated or concurrent in-process main() calls can share it
+    without a lock or copy.
+    """
+    parser = argparse.ArgumentParser(prog="adaad6", description="ADAAD-6 deterministic CLI")
+    sub = parser.add_subparsers(dest="command", required=True)
+    for name, (help_text, populate) in _SUBCOMMANDS.items():
+        subparser = sub.add_parser(name, help=help_text)
+        if name == command and populate is not None:
+            populate(subparser)
     return parser
 
 
-def main(argv: list[str] | None = None) -> int:
-    parser = _build_parser()
-    args = parser.parse_args(argv)
+# Subcommand handlers: each takes the parsed args and its parser and returns the exit code.
+# Modules are imported inside the handler that needs them, so only the selected command pays.
+
+
+def _load_config() -> Any:
+    from adaad6.config import load_config
+
+    return load_config()
+
+
+def _cmd_version(args: argparse.Namespace, parser: argparse.ArgumentParser) -> int:
+    # No config load: validate() pins config_schema_version to this constant.
+    from adaad6.config import CONFIG_SCHEMA_VERSION
+
+    try:
+        from adaad6.version import __version__ as pkg_version
+    except Exception:
+        pkg_version = None
+    _emit(
+        {
+            "ok": True,
+            "package_version": pkg_version,
+            "python": sys.version.split()[0],
+            "config_schema_version": CONFIG_SCHEMA_VERSION,
+        }
+    )
+    return 0
+
+
+def _cmd_boot(args: argparse.Namespace, parser: argparse.ArgumentParser) -> int:
+    cfg = _load_config()
+
+    from adaad6.runtime.boot import boot_sequence
+
+    result = boot_sequence(cfg=cfg)
+    outcome = "ok" if result.get("ok") else "error"
+    _safe_cli_log(cfg, action="boot", outcome=outcome, details={"result": result})
+    _emit(result)
+    return 0 if result.get("ok") else 1
+
+
+def _cmd_health(args: argparse.Namespace, parser: argparse.ArgumentParser) -> int:
+    cfg = _load_config()
+
+    from adaad6.runtime.health import check_structure_details
+
+    details = check_structure_details(cfg=cfg)
+    structure = details.get("structure") or {}
+    ledger_dirs = details.get("ledger_dirs") or {}
+    ok = bool(structure.get("ok", structure is True)) and bool(ledger_dirs.get("ok", ledger_dirs is True))
+    _safe_cli_log(cfg, action="health", outcome="ok" if ok else "error", details={"details": details})
+    _emit({"ok": ok, "details": details})
+    return 0 if ok else 1
+
+
+def _cmd_doctor(args: argparse.Namespace, parser: argparse.ArgumentParser) -> int:
+    cfg = _load_config()
+
+    # Backward-compatible default to run when no subcommand is provided.
+    doctor_cmd = args.doctor_command or "run"
+
+    if doctor_cmd == "template":
+        if args.report or args.no_template or args.output != "json":
+            parser.error("doctor template does not accept --output/--report/--no-template")
+        from adaad6.planning.templates import compose_doctor_report_template
+
+        template = compose_doctor_report_template(destination=args.report_path).to_dict()
+        payload = {"ok": True, "template": template}
+        _safe_cli_log(cfg, action="doctor_template", outcome="ok", details={"report": payload})
+        _emit(payload)
+        return 0
+    if doctor_cmd != "run":
+        parser.error("unknown doctor subcommand")
+
+    from adaad6.assurance import run_doctor
+
+    report = run_doctor(cfg=cfg)
+    outcome = "ok" if report.get("ok") else "error"
+
+    output_mode = args.output
+    if args.report:
+        output_mode = "both"
+
+    want_json = output_mode in {"json", "both"}
+    want_human = output_mode in {"text", "both"}
+
+    human = _doctor_human_summary(report) if want_human else ""
+
+    template = None
+    if want_json and not args.no_template:
+        from adaad6.planning.templates import compose_doctor_report_template
+
+        template = compose_doctor_report_template(destination=args.report_path).to_dict()
+
+    machine_payload: dict[str, Any] = {"ok": bool(report.get("ok")), "report": report}
+    if template is not None:
+        machine_payload["template"] = template
+    if output_mode == "both":
+        machine_payload["human_readable"] = human
+
+    _safe_cli_log(cfg, action="doctor", outcome=outcome, details={"report": machine_payload})
 
+    if want_json:
+        _emit(machine_payload)
+    if want_human:
+        _emit_stderr(human)
+
+    return 0 if report.get("ok") else 1
+
+
+def _cmd_plan(args: argparse.Namespace, parser: argparse.ArgumentParser) -> int:
+    cfg = _load_config()
+
+    from adaad6.planning.planner import make_plan
+
+    plan = make_plan(goal=args.goal, cfg=cfg)
+    _safe_cli_log(cfg, action="plan", outcome="ok", details={"goal": args.goal, "plan": plan.to_dict()})
+    _emit({"ok": True, "plan": plan.to_dict()})
+    return 0
+
+
+def _cmd_template(args: argparse.Namespace, parser: argparse.ArgumentParser) -> int:
+    cfg = _load_config()
+
+    destination = args.destination
+    if args.name == "doctor_report":
+        from adaad6.planning.templates import compose_doctor_report_template
+
+        template = compose_doctor_report_template(destination=destination or "doctor_report.txt").to_dict()
+    elif args.name == "diff_report":
+        from adaad6.planning.templates import compose_diff_report_template
+
+        template = compose_diff_report_template(
+            base_ref=args.base_ref,
+            destination=destination or "changelog.md",
+        ).to_dict()
+    else:
+        from adaad6.planning.templates import compose_scaffold_template
+
+        template = compose_scaffold_template(destination=destination or "scaffold_report.txt").to_dict()
+    _safe_cli_log(cfg, action="template", outcome="ok", details={"name": args.name, "template": template})
+    _emit({"ok": True, "template": template})
+    return 0
+
+
+def _cmd_run(args: argparse.Namespace, parser: argparse.ArgumentParser) -> int:
+    cfg = _load_config()
+
+    inputs = _parse_json_object(args.inputs)
+    adapter = _EchoAdapter()
+    result = adapter.run(intent=args.intent, inputs=inputs, actor=args.actor, cfg=cfg)
+    _safe_cli_log(
+        cfg,
+        action="run",
+        outcome="ok" if result.ok else "error",
+        details={"intent": args.intent, "inputs": inputs, "result": result.output, "log": result.log},
+    )
+    _emit({"ok": result.ok, "output": result.output, "log": result.log})
+    return 0 if result.ok else 1
+
+
+def _cmd_ledger(args: argparse.Namespace, parser: argparse.ArgumentParser) -> int:
+    cfg = _load_config()
+
+    limit = args.limit if args.limit is None or args.limit >= 0 else None
+    from adaad6.provenance.ledger import read_events
+
+    if not getattr(cfg, "ledger_enabled", False):
+        _emit({"ok": False, "error": "ledger disabled"})
+        return 2
     try:
-        from adaad6.config import load_config
+        events = read_events(cfg, limit=limit if args.ledger_command == "tail" else None)
+    except FileNotFoundError:
+        _emit({"ok": False, "error": "ledger not initialized"})
+        return 2
+
+    if args.ledger_command == "tail":
+        _emit({"ok": True, "count": len(events)})
+        sys.stdout.flush()  # header first, so consumers can act on the count
+        _write_stdout_lines(_dump(event) for event in events)
+        return 0
+    if args.ledger_command == "verify":
+        from adaad6.provenance.hashchain import verify_chain
+
+        valid = verify_chain(events)
+        _emit({"ok": valid, "valid": valid, "count": len(events)})
+        return 0 if valid else 1
+    raise ValueError(f"Unknown command: {args.command}")
+
+
+# Dispatch table for main(); keys match _SUBCOMMANDS.
+_COMMANDS: dict[str, Callable[[argparse.Namespace, argparse.ArgumentParser], int]] = {
+    "boot": _cmd_boot,
+    "health": _cmd_health,
+    "doctor": _cmd_doctor,
+    "version": _cmd_version,
+    "plan": _cmd_plan,
+    "template": _cmd_template,
+    "run": _cmd_run,
+    "ledger": _cmd_ledger,
+}
 
-        cfg = load_config()
-
-        if args.command == "boot":
-            from adaad6.runtime.boot import boot_sequence
 
-            result = boot_sequence(cfg=cfg)
-            outcome = "ok" if result.get("ok") else "error"
-            _safe_cli_log(cfg, action="boot", outcome=outcome, details={"result": result})
-            _emit(result)
-            return 0 if result.get("ok") else 1
-
-        if args.command == "health":
-            from adaad6.runtime.health import check_structure_details
-
-            details = check_structure_details(cfg=cfg)
-            structure = details.get("structure") or {}
-            ledger_dirs = details.get("ledger_dirs") or {}
-            ok = bool(structure.get("ok", structure is True)) and bool(ledger_dirs.get("ok", ledger_dirs is True))
-            _safe_cli_log(cfg, action="health", outcome="ok" if ok else "error", details={"details": details})
-            _emit({"ok": ok, "details": details})
-            return 0 if ok else 1
-
-        if args.command == "doctor":
-            # Backward-compatible default to run when no subcommand is provided.
-            doctor_cmd = getattr(args, "doctor_command", None) or "run"
-
-            if doctor_cmd == "template":
-                if getattr(args, "report", False) or getattr(args, "no_template", False) or getattr(args, "output", "json") != "json":
-                    parser.error("doctor template does not accept --output/--report/--no-template")
-                from adaad6.planning.templates import compose_doctor_report_template
-
-                template = compose_doctor_report_template(destination=args.report_path).to_dict()
-                payload = {"ok": True, "template": template}
-                _safe_cli_log(cfg, action="doctor_template", outcome="ok", details={"report": payload})
-                _emit(payload)
-                return 0
-            if doctor_cmd != "run":
-                parser.error("unknown doctor subcommand")
-
-            from adaad6.assurance import run_doctor
-
-            report = run_doctor(cfg=cfg)
-            outcome = "ok" if report.get("ok") else "error"
-
-            output_mode = getattr(args, "output", "json")
-            if getattr(args, "report", False):
-                output_mode = "both"
-
-            want_json = output_mode in {"json", "both"}
-            want_human = output_mode in {"text", "both"}
-
-            human = _doctor_human_summary(report) if want_human else ""
-
-            template = None
-            if want_json and not getattr(args, "no_template", False):
-                from adaad6.planning.templates import compose_doctor_report_template
-
-                template = compose_doctor_report_template(destination=args.report_path).to_dict()
-
-            machine_payload: dict[str, Any] = {"ok": bool(report.get("ok")), "report": report}
-            if template is not None:
-                machine_payload["template"] = template
-            if output_mode == "both":
-                machine_payload["human_readable"] = human
-
-            _safe_cli_log(cfg, action="doctor", outcome=outcome, details={"report": machine_payload})
-
-            if want_json:
-                _emit(machine_payload)
-            if want_human:
-                _emit_stderr(human)
-
-            return 0 if report.get("ok") else 1
-
-        if args.command == "plan":
-            from adaad6.planning.planner import make_plan
-
-            plan = make_plan(goal=args.goal, cfg=cfg)
-            _safe_cli_log(cfg, action="plan", outcome="ok", details={"goal": args.goal, "plan": plan.to_dict()})
-            _emit({"ok": True, "plan": plan.to_dict()})
-            return 0
-
-        if args.command == "template":
-            destination = getattr(args, "destination", None)
-            if args.name == "doctor_report":
-                from adaad6.planning.templates import compose_doctor_report_template
-
-                template = compose_doctor_report_template(destination=destination or "doctor_report.txt").to_dict()
-            elif args.name == "diff_report":
-                from adaad6.planning.templates import compose_diff_report_template
-
-                template = compose_diff_report_template(
-                    base_ref=getattr(args, "base_ref", "HEAD"),
-                    destination=destination or "changelog.md",
-                ).to_dict()
-            else:
-                from adaad6.planning.templates import compose_scaffold_template
-
-                template = compose_scaffold_template(destination=destination or "scaffold_report.txt").to_dict()
-            _safe_cli_log(cfg, action="template", outcome="ok", details={"name": args.name, "template": template})
-            _emit({"ok": True, "template": template})
-            return 0
-
-        if args.command == "run":
-            inputs = _parse_json_object(args.inputs)
-            adapter = _EchoAdapter()
-            result = adapter.run(intent=args.intent, inputs=inputs, actor=args.actor, cfg=cfg)
-            _safe_cli_log(
-                cfg,
-                action="run",
-                outcome="ok" if result.ok else "error",
-                details={"intent": args.intent, "inputs": inputs, "result": result.output, "log": result.log},
-            )
-            _emit({"ok": result.ok, "output": result.output, "log": result.log})
-            return 0 if result.ok else 1
-
-        if args.command == "ledger":
-            limit = args.limit if hasattr(args, "limit") and (args.limit is None or args.limit >= 0) else None
-            from adaad6.provenance.ledger import read_events
-
-            if not getattr(cfg, "ledger_enabled", False):
-                _emit({"ok": False, "error": "ledger disabled"})
-                return 2
-            try:
-                events = read_events(cfg, limit=limit if args.ledger_command == "tail" else None)
-            except FileNotFoundError:
-                _emit({"ok": False, "error": "ledger not initialized"})
-                return 2
-
-            if args.ledger_command == "tail":
-                _emit({"ok": True, "count": len(events)})
-                for event in events:
-                    sys.stdout.write(_dump(event) + "\n")
-                return 0
-            if args.ledger_command == "verify":
-                from adaad6.provenance.hashchain import verify_chain
-
-                valid = verify_chain(events)
-                _emit({"ok": valid, "valid": valid, "count": len(events)})
-                return 0 if valid else 1
-
-        if args.command == "version":
-            try:
-                from adaad6.version import __version__ as pkg_version
-            except Exception:
-                pkg_version = None
-            _emit(
-                {
-                    "ok": True,
-                    "package_version": pkg_version,
-                    "python": sys.version.split()[0],
-                    "config_schema_version": getattr(cfg, "config_schema_version", None),
-                }
-            )
-            return 0
-
-        raise ValueError(f"Unknown command: {args.command}")
+def main(argv: list[str] | None = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+    # _emit writes to sys.stdout.buffer directly; anything already sitting in the text
+    # layer (print() by the caller or an embedding app) must come out ahead of it.
+    sys.stdout.flush()
+    try:
+        parser = _build_parser(_selected_command(argv))
+        args = parser.parse_args(argv)
+        handler = _COMMANDS.get(args.command)
+        if handler is None:
+            raise ValueError(f"Unknown command: {args.command}")
+        return handler(args, parser)
     except Exception as exc:  # pragma: no cover - CLI safety net
         _emit({"ok": False, "error": str(exc)})
         return 1
+    finally:
+        sys.stdout.flush()
 
 
 __all__ = ["main"]
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-import hashlib
 import hmac
 import os
+import stat
 from dataclasses import dataclass, replace
 from enum import Enum
-from pathlib import Path, PurePosixPath, PureWindowsPath
+from pathlib import Path
 from typing import Callable, Iterable, Mapping
 
 ENV_PREFIX = "ADAAD6_"
@@ -30,6 +30,12 @@ class RunMode(str, Enum):
     PROD = "prod"
 
 
+_DEFAULT_LEDGER_FILENAME = "events.jsonl"
+# hard caps on the (tier-scaled) planner time budget
+_PLANNER_SECONDS_MIN = 0.01
+_PLANNER_SECONDS_MAX = 300.0
+
+
 @dataclass(frozen=True)
 class AdaadConfig:
     version: str = "0.0.0"
@@ -52,14 +58,18 @@ class AdaadConfig:
 
     log_schema_version: str = "1"
     log_path: str = ".adaad/logs/adaad6.jsonl"
+    # CLI commands append their outcome to log_path when enabled
+    cli_logging_enabled: bool = True
     telemetry_exports: tuple[str, ...] = ()
 
     ledger_enabled: bool = False
     ledger_dir: str = ".adaad/ledger"
-    ledger_filename: str = "events.jsonl"
+    ledger_filename: str = _DEFAULT_LEDGER_FILENAME
     ledger_file: str | None = None
     ledger_schema_version: str = "1"
     ledger_readonly: bool = False
+    # adapter ledger events buffered per write (1 = append on every call)
+    ledger_batch_size: int = 1
 
     emergency_halt: bool = False
     agents_enabled: bool = True
@@ -72,65 +82,56 @@ class AdaadConfig:
 
     def __post_init__(self) -> None:
         # honor legacy ledger_file alias without overriding explicit filename
-        default_filename = type(self).ledger_filename
-        if self.ledger_file and (self.ledger_filename == default_filename or not self.ledger_filename):
+        if self.ledger_file and (self.ledger_filename == _DEFAULT_LEDGER_FILENAME or not self.ledger_filename):
             object.__setattr__(self, "ledger_filename", self.ledger_file)
-        if self.ledger_file is None:
-            object.__setattr__(self, "ledger_file", self.ledger_filename)
-        elif self.ledger_file != self.ledger_filename:
+        # ledger_file always mirrors the effective filename
+        if self.ledger_file != self.ledger_filename:
             object.__setattr__(self, "ledger_file", self.ledger_filename)
 
         telemetry_exports = tuple(self.telemetry_exports or ())
         if telemetry_exports != self.telemetry_exports:
             object.__setattr__(self, "telemetry_exports", telemetry_exports)
 
+    def validate_once(self) -> None:
+        """
+        validate() on first use only. The config is immutable, so later calls skip the
+        filesystem sandbox checks; call validate() directly to re-check them.
+        """
+        if self.__dict__.get("_validated"):
+            return
+        self.validate()
+
     def validate(self) -> None:
-        if (self.config_schema_version or "").strip() != CONFIG_SCHEMA_VERSION:
+        # Field-only checks run first; the filesystem work (resolving home, the
+        # sandbox walks) only starts once the config is otherwise well-formed.
+        schema_version = self.config_schema_version
+        if schema_version != CONFIG_SCHEMA_VERSION and (schema_version or "").strip() != CONFIG_SCHEMA_VERSION:
             raise ValueError("config_schema_version mismatch")
 
-        if not (self.log_path or "").strip():
+        if not _non_empty(self.log_path):
             raise ValueError("log_path must be set")
 
-        home = Path(self.home).expanduser().resolve()
-        _enforce_log_path_sandbox(self.log_path, home=home)
-
         # hard caps
         if not (1 <= self.planner_max_steps <= 10_000):
             raise ValueError("planner_max_steps must be 1..10000")
-        if not (0.01 <= self.planner_max_seconds <= 300.0):
+        if not (_PLANNER_SECONDS_MIN <= self.planner_max_seconds <= _PLANNER_SECONDS_MAX):
             raise ValueError("planner_max_seconds must be 0.01..300")
+        if not (1 <= self.ledger_batch_size <= 10_000):
+            raise ValueError("ledger_batch_size must be 1..10000")
 
-        if self.mutation_policy == MutationPolicy.EVOLUTIONARY and not (self.readiness_gate_sig or "").strip():
+        if self.mutation_policy == MutationPolicy.EVOLUTIONARY and not _non_empty(self.readiness_gate_sig):
             raise ValueError("EVOLUTIONARY mutation_policy requires readiness_gate_sig")
 
-        if self.ledger_enabled and not (self.ledger_dir or "").strip():
-            raise ValueError("ledger_dir must be set when ledger logging is enabled")
-        if self.ledger_enabled and not (self.ledger_filename or "").strip():
-            raise ValueError("ledger_filename must be set when ledger logging is enabled")
-
-        _enforce_actions_dir_sandbox(self.actions_dir, home=home)
-
-        if self.telemetry_exports:
-            for path in self.telemetry_exports:
-                _enforce_log_path_sandbox(path, home=home)
-
         if self.ledger_enabled:
+            if not _non_empty(self.ledger_dir):
+                raise ValueError("ledger_dir must be set when ledger logging is enabled")
+            if not _non_empty(self.ledger_filename):
+                raise ValueError("ledger_filename must be set when ledger logging is enabled")
             # filename is a relative path only
-            ledger_file_raw = (self.ledger_filename or "").strip()
-            posix = PurePosixPath(ledger_file_raw)
-            win = PureWindowsPath(ledger_file_raw)
-
-            if posix.is_absolute() or win.is_absolute() or win.drive:
-                raise ValueError("ledger_filename must be a relative path")
-            if ledger_file_raw.startswith("~"):
-                raise ValueError("ledger_filename must not start with ~")
-            if ".." in posix.parts or ".." in win.parts:
-                raise ValueError("ledger_filename must not contain parent directory traversal")
-            if not (self.ledger_schema_version or "").strip():
+            _check_relative_safe(self.ledger_filename.strip(), "ledger_filename")
+            if not _non_empty(self.ledger_schema_version):
                 raise ValueError("ledger_schema_version must be set when ledger logging is enabled")
 
-            _enforce_ledger_dir_sandbox(self.ledger_dir, home=home)
-
         if self.emergency_halt:
             # freeze must dominate any other settings
             if self.mutation_policy != MutationPolicy.LOCKED:
@@ -140,27 +141,85 @@ class AdaadConfig:
             if self.agents_enabled:
                 raise ValueError("emergency_halt requires agents_enabled=False")
 
+        home = Path(self.home).expanduser().resolve()
+        _enforce_log_path_sandbox(self.log_path, home=home)
+        _enforce_actions_dir_sandbox(self.actions_dir, home=home)
+        for path in self.telemetry_exports:
+            _enforce_log_path_sandbox(path, home=home)
+        if self.ledger_enabled:
+            _enforce_ledger_dir_sandbox(self.ledger_dir, home=home)
+
+        # not a dataclass field: stays out of asdict/eq/repr and is not copied by replace()
+        object.__setattr__(self, "_validated", True)
+
+
+# Prefixed spellings of the (fixed, in-code) keys passed to _get_env, built once so
+# each lookup reuses a str whose hash is already cached.
+_PREFIXED_KEYS: dict[str, str] = {}
+
 
 def _get_env(env: Mapping[str, str], key: str) -> str | None:
-    return env.get(f"{ENV_PREFIX}{key}") or env.get(key)
+    prefixed = _PREFIXED_KEYS.get(key)
+    if prefixed is None:
+        prefixed = _PREFIXED_KEYS[key] = f"{ENV_PREFIX}{key}"
+    return env.get(prefixed) or env.get(key)
+
+
+def _non_empty(value: str | None) -> bool:
+    # same as bool((value or "").strip()) without allocating the stripped copy
+    return bool(value) and not value.isspace()
+
+
+def _env_view(env: Mapping[str, str]) -> dict[str, str]:
+    """
+    Resolve the ENV_PREFIX fallback once: view.get(key) == _get_env(env, key).
+
+    A non-empty prefixed value shadows the bare key; an empty one falls through to
+    it, exactly as the `or` in _get_env does.
+    """
+    view = dict(env)
+    prefix_len = len(ENV_PREFIX)
+    for key, value in env.items():
+        if value and key.startswith(ENV_PREFIX):
+            view[key[prefix_len:]] = value
+    return view
 
 
 def _require_sig_alg(env: Mapping[str, str]) -> bool:
-    alg = (_get_env(env, "CONFIG_SIG_ALG") or "").strip()
+    alg = _get_env(env, "CONFIG_SIG_ALG")
+    if alg == SIG_ALG:
+        return True
+    alg = (alg or "").strip()
     if not alg:
         return False
     return alg.upper() == SIG_ALG
 
 
+# Keys are the accepted spellings plus their Title/UPPER casings, so the common
+# env values resolve without strip()/lower().
+_BOOL_MAP: dict[str, bool] = {
+    spelling: flag
+    for word, flag in (
+        ("1", True),
+        ("true", True),
+        ("yes", True),
+        ("on", True),
+        ("0", False),
+        ("false", False),
+        ("no", False),
+        ("off", False),
+    )
+    for spelling in (word, word.title(), word.upper())
+}
+
+
 def _coerce_bool(value: str) -> bool:
-    truthy = {"1", "true", "yes", "on"}
-    falsy = {"0", "false", "no", "off"}
-    lowered = value.strip().lower()
-    if lowered in truthy:
-        return True
-    if lowered in falsy:
-        return False
-    raise ValueError(f"Invalid boolean value: {value}")
+    hit = _BOOL_MAP.get(value)
+    if hit is None:
+        hit = _BOOL_MAP.get(value.strip().lower())
+    if hit is None:
+        raise ValueError(f"Invalid boolean value: {value}")
+    return hit
 
 
 def _coerce_int(value: str, field: str) -> int:
@@ -177,37 +236,63 @@ def _coerce_float(value: str, field: str) -> float:
         raise ValueError(f"Invalid float for {field}: {value}") from exc
 
 
+def _env_bool(env: Mapping[str, str], key: str, default: bool) -> bool:
+    raw = env.get(key)
+    return _coerce_bool(raw) if raw else default
+
+
+def _env_int(env: Mapping[str, str], key: str, field: str, default: int) -> int:
+    raw = env.get(key)
+    return _coerce_int(raw, field) if raw else default
+
+
+def _env_float(env: Mapping[str, str], key: str, field: str, default: float) -> float:
+    raw = env.get(key)
+    return _coerce_float(raw, field) if raw else default
+
+
+_ENUM_MAPS: dict[type[Enum], dict[str, Enum]] = {
+    enum_cls: {member.value: member for member in enum_cls} for enum_cls in (MutationPolicy, ResourceTier, RunMode)
+}
+
+
 def _coerce_enum(value: str, enum_cls, field: str):
-    raw = value.strip().lower()
-    try:
-        return enum_cls(raw)
-    except Exception as exc:
+    members = _ENUM_MAPS[enum_cls]
+    # exact canonical spelling (every default and most env values) skips strip()/lower()
+    member = members.get(value)
+    if member is None:
+        member = members.get(value.strip().lower())
+    if member is None:
         allowed = ", ".join([e.value for e in enum_cls])
-        raise ValueError(f"Invalid {field}: {value}. Allowed: {allowed}") from exc
+        raise ValueError(f"Invalid {field}: {value}. Allowed: {allowed}")
+    return member
 
 
 def _dev_env_key_provider(env: Mapping[str, str]) -> str | None:
     return _get_env(env, "CONFIG_SIG_KEY")
 
 
-def _canonical_env_payload(env: Mapping[str, str], *, extra_excluded: Iterable[str] | None = None) -> bytes:
-    excluded = {
+_SIGNATURE_ENV_KEYS = frozenset(
+    {
         f"{ENV_PREFIX}CONFIG_SIG",
         f"{ENV_PREFIX}CONFIG_SIG_ALG",
         f"{ENV_PREFIX}CONFIG_SIG_KEY",
         f"{ENV_PREFIX}READINESS_GATE_SIG",
     }
-    if extra_excluded:
-        excluded.update(extra_excluded)
-    items = []
-    for k, v in env.items():
-        if not k.startswith(ENV_PREFIX):
-            continue
-        if k in excluded:
-            continue
-        items.append((k, v))
-    items.sort(key=lambda kv: kv[0])
-    return "".join([f"{k}={v}\n" for k, v in items]).encode("utf-8")
+)
+
+
+def _canonical_env_payload(env: Mapping[str, str], *, extra_excluded: Iterable[str] | None = None) -> bytes:
+    excluded = _SIGNATURE_ENV_KEYS.union(extra_excluded) if extra_excluded else _SIGNATURE_ENV_KEYS
+    # Keys are unique, so sorting the keys alone orders the pairs. The lines are
+    # joined as str and encoded in one call rather than encoding every key and value.
+    keys = sorted(k for k in env if k.startswith(ENV_PREFIX) and k not in excluded)
+    return "".join([f"{k}={env[k]}\n" for k in keys]).encode("utf-8")
+
+
+def _hmac_sha256(key: bytes, payload: bytes) -> bytes:
+    # hmac.digest runs one-shot in C without building an HMAC object
+    return hmac.digest(key, payload, "sha256")
 
 
 def _verify_env_signature(
@@ -216,15 +301,25 @@ def _verify_env_signature(
     mode: RunMode,
     key_provider: Callable[[Mapping[str, str]], str | None],
 ) -> bool:
+    # cheapest rejections first; the env payload is only encoded once a key is in hand
+    sig_hex = _get_env(env, "CONFIG_SIG")
+    if not sig_hex:
+        return False
+    # A malformed signature can never match, so it is rejected before the key is
+    # requested or the MAC computed. The length check keeps the old hex-string
+    # semantics: bytes.fromhex would otherwise skip whitespace between hex pairs.
+    sig_hex = sig_hex.strip()
+    if len(sig_hex) != 64:
+        return False
+    try:
+        sig = bytes.fromhex(sig_hex)
+    except ValueError:
+        return False
     if not _require_sig_alg(env):
         return False
     if (_get_env(env, "CONFIG_SCHEMA_VERSION") or "").strip() != CONFIG_SCHEMA_VERSION:
         return False
 
-    sig_hex = _get_env(env, "CONFIG_SIG")
-    if not sig_hex:
-        return False
-
     if mode == RunMode.PROD and _get_env(env, "CONFIG_SIG_KEY"):
         return False
 
@@ -233,8 +328,7 @@ def _verify_env_signature(
         return False
 
     payload = _canonical_env_payload(env)
-    mac = hmac.new(key.encode("utf-8"), payload, hashlib.sha256).hexdigest()
-    return hmac.compare_digest(mac, sig_hex.strip().lower())
+    return hmac.compare_digest(_hmac_sha256(key.encode("utf-8"), payload), sig)
 
 
 def _canonical_config_payload(cfg: AdaadConfig) -> bytes:
@@ -259,8 +353,7 @@ def _canonical_config_payload(cfg: AdaadConfig) -> bytes:
         "telemetry_exports": ",".join(cfg.telemetry_exports),
         "version": cfg.version,
     }
-    ordered = [f"{key}={fields[key]}" for key in sorted(fields)]
-    return ("\n".join(ordered) + "\n").encode("utf-8")
+    return "".join([f"{key}={fields[key]}\n" for key in sorted(fields)]).encode("utf-8")
 
 
 def _readiness_signature_payload(cfg: AdaadConfig, env: Mapping[str, str]) -> bytes:
@@ -276,7 +369,7 @@ def _readiness_signature_payload(cfg: AdaadConfig, env: Mapping[str, str]) -> by
 
 def compute_readiness_gate_signature(cfg: AdaadConfig, env: Mapping[str, str], *, key: str) -> str:
     payload = _readiness_signature_payload(cfg, env)
-    return hmac.new(key.encode("utf-8"), payload, hashlib.sha256).hexdigest()
+    return _hmac_sha256(key.encode("utf-8"), payload).hex()
 
 
 def verify_readiness_gate_signature(
@@ -328,13 +421,38 @@ def _resolve_home(env: Mapping[str, str]) -> Path:
     return Path(".").resolve()
 
 
-def _resource_scaling_for_tier(tier: ResourceTier) -> float:
-    # deterministic constants
-    if tier == ResourceTier.MOBILE:
-        return 2.5
-    if tier == ResourceTier.EDGE:
-        return 1.5
-    return 1.0  # server
+# deterministic constants
+_TIER_SCALING: dict[ResourceTier, float] = {
+    ResourceTier.MOBILE: 2.5,
+    ResourceTier.EDGE: 1.5,
+    ResourceTier.SERVER: 1.0,
+}
+
+
+def _check_relative_safe(raw: str, field: str) -> None:
+    # Rejects absolute, rooted, drive-qualified, ~-prefixed and ..-traversing paths
+    # under both POSIX and Windows separators, with plain string checks.
+    if raw[:1] in ("/", "\\") or raw[1:2] == ":":
+        raise ValueError(f"{field} must be a relative path")
+    if raw.startswith("~"):
+        raise ValueError(f"{field} must not start with ~")
+    if ".." in raw.replace("\\", "/").split("/"):
+        raise ValueError(f"{field} must not contain parent directory traversal")
+
+
+def _traverses_symlink(base: Path, parts: Iterable[str]) -> bool:
+    # One lstat per component on a plain str path. A symlink only counts when its
+    # target exists, and nothing below a missing component can exist.
+    current = str(base)
+    for part in parts:
+        current = os.path.join(current, part)
+        try:
+            st = os.lstat(current)
+        except (FileNotFoundError, NotADirectoryError):
+            return False
+        if stat.S_ISLNK(st.st_mode) and os.path.exists(current):
+            return True
+    return False
 
 
 def _enforce_ledger_dir_sandbox(ledger_dir: str, *, home: Path) -> None:
@@ -353,32 +471,20 @@ def _enforce_ledger_dir_sandbox(ledger_dir: str, *, home: Path) -> None:
     except TypeError:
         target_resolved = Path(os.path.abspath(str(target)))
 
-    if base not in target_resolved.parents and target_resolved != base:
-        raise ValueError("ledger_dir must resolve under .adaad/ (sandbox violation)")
-
+    # relative_to() succeeds exactly when base is target_resolved or one of its
+    # parents, so one call replaces the .parents membership scan
     try:
         rel = target_resolved.relative_to(base)
-    except Exception as exc:
-        raise ValueError("ledger_dir sandbox violation") from exc
+    except ValueError as exc:
+        raise ValueError("ledger_dir must resolve under .adaad/ (sandbox violation)") from exc
 
-    probe = base
-    for part in rel.parts:
-        probe = probe / part
-        if probe.exists() and probe.is_symlink():
-            raise ValueError("ledger_dir must not traverse symlinks (sandbox violation)")
+    if _traverses_symlink(base, rel.parts):
+        raise ValueError("ledger_dir must not traverse symlinks (sandbox violation)")
 
 
 def _enforce_log_path_sandbox(log_path: str, *, home: Path) -> None:
     raw = (log_path or "").strip()
-    posix = PurePosixPath(raw)
-    win = PureWindowsPath(raw)
-
-    if posix.is_absolute() or win.is_absolute() or win.drive:
-        raise ValueError("log_path must be a relative path")
-    if raw.startswith("~"):
-        raise ValueError("log_path must not start with ~")
-    if ".." in posix.parts or ".." in win.parts:
-        raise ValueError("log_path must not contain parent directory traversal")
+    _check_relative_safe(raw, "log_path")
 
     target = home / raw
     try:
@@ -391,11 +497,8 @@ def _enforce_log_path_sandbox(log_path: str, *, home: Path) -> None:
     except Exception as exc:
         raise ValueError("log_path must resolve under home/") from exc
 
-    probe = home
-    for part in rel.parts[:-1]:  # directories only, ignore filename
-        probe = probe / part
-        if probe.exists() and probe.is_symlink():
-            raise ValueError("log_path must not traverse symlinks")
+    if _traverses_symlink(home, rel.parts[:-1]):  # directories only, ignore filename
+        raise ValueError("log_path must not traverse symlinks")
 
 
 def _enforce_actions_dir_sandbox(actions_dir: str, *, home: Path) -> None:
@@ -403,15 +506,7 @@ def _enforce_actions_dir_sandbox(actions_dir: str, *, home: Path) -> None:
     if not raw:
         raise ValueError("actions_dir must be set")
 
-    posix = PurePosixPath(raw)
-    win = PureWindowsPath(raw)
-
-    if posix.is_absolute() or win.is_absolute() or win.drive:
-        raise ValueError("actions_dir must be a relative path")
-    if raw.startswith("~"):
-        raise ValueError("actions_dir must not start with ~")
-    if ".." in posix.parts or ".." in win.parts:
-        raise ValueError("actions_dir must not contain parent directory traversal")
+    _check_relative_safe(raw, "actions_dir")
 
     target = home / raw
     try:
@@ -424,11 +519,8 @@ def _enforce_actions_dir_sandbox(actions_dir: str, *, home: Path) -> None:
     except Exception as exc:
         raise ValueError("actions_dir must resolve under home/") from exc
 
-    probe = home
-    for part in rel.parts:
-        probe = probe / part
-        if probe.exists() and probe.is_symlink():
-            raise ValueError("actions_dir must not traverse symlinks")
+    if _traverses_symlink(home, rel.parts):
+        raise ValueError("actions_dir must not traverse symlinks")
 
 
 def load_config(
@@ -437,35 +529,46 @@ def load_config(
     key_provider: Callable[[Mapping[str, str]], str | None] = _dev_env_key_provider,
 ) -> AdaadConfig:
     source: Mapping[str, str] = env or os.environ
-
-    mode = _coerce_enum(_get_env(source, "MODE") or RunMode.DEV.value, RunMode, "mode")
-    cfg_schema_raw = (_get_env(source, "CONFIG_SCHEMA_VERSION") or "").strip()
+    # the signature check and the key provider still see the raw source
+    env = _env_view(source)
+    mode = _coerce_enum(env.get("MODE") or RunMode.DEV.value, RunMode, "mode")
+    cfg_schema_raw = (env.get("CONFIG_SCHEMA_VERSION") or "").strip()
     schema_mismatch = bool(cfg_schema_raw and cfg_schema_raw != CONFIG_SCHEMA_VERSION)
     cfg_schema = CONFIG_SCHEMA_VERSION
     home = _resolve_home(source)
-    log_path = _get_env(source, "LOG_PATH") or AdaadConfig.log_path
-    actions_dir = _get_env(source, "ACTIONS_DIR") or AdaadConfig.actions_dir
-    telemetry_exports_raw = _get_env(source, "TELEMETRY_EXPORTS")
+    log_path = env.get("LOG_PATH") or AdaadConfig.log_path
+    actions_dir = env.get("ACTIONS_DIR") or AdaadConfig.actions_dir
+    telemetry_exports_raw = env.get("TELEMETRY_EXPORTS")
     telemetry_exports = tuple(
         part.strip()
         for part in (telemetry_exports_raw.split(",") if telemetry_exports_raw else ())
         if part.strip()
     )
 
-    sig_required_raw = _get_env(source, "CONFIG_SIG_REQUIRED")
-    sig_required = _coerce_bool(sig_required_raw) if sig_required_raw else True
+    sig_required = _env_bool(env, "CONFIG_SIG_REQUIRED", True)
 
     # prod safety: default provider is dev-only. force explicit secure provider in prod.
     if mode == RunMode.PROD and key_provider is _dev_env_key_provider:
         sig_required = True
 
-    emergency_halt_raw = _get_env(source, "EMERGENCY_HALT")
-    emergency_halt = _coerce_bool(emergency_halt_raw) if emergency_halt_raw else False
+    emergency_halt = _env_bool(env, "EMERGENCY_HALT", False)
 
     # signature gate
-    sig_ok = _verify_env_signature(source, mode=mode, key_provider=key_provider) if sig_required else True
+    # a schema mismatch freezes regardless of the signature, so don't verify it
+    sig_ok = (
+        _verify_env_signature(source, mode=mode, key_provider=key_provider)
+        if sig_required and not schema_mismatch
+        else True
+    )
     must_freeze = schema_mismatch or (sig_required and not sig_ok)
 
+    # plain string settings shared by the frozen and normal configs
+    version = env.get("VERSION") or AdaadConfig.version
+    log_schema_version = env.get("LOG_SCHEMA_VERSION") or AdaadConfig.log_schema_version
+    ledger_dir = env.get("LEDGER_DIR") or AdaadConfig.ledger_dir
+    ledger_filename = env.get("LEDGER_FILE") or env.get("LEDGER_FILENAME") or AdaadConfig.ledger_filename
+    ledger_schema_version = env.get("LEDGER_SCHEMA_VERSION") or log_schema_version
+
     # if signature fails, freeze
     if must_freeze:
         if schema_mismatch:
@@ -478,74 +581,58 @@ def load_config(
                 reason = "CONFIG_SIG_KEY_UNAVAILABLE"
             else:
                 reason = "CONFIG_SIG_INVALID"
+        frozen_tier = _coerce_enum(env.get("RESOURCE_TIER") or "mobile", ResourceTier, "resource_tier")
         cfg = AdaadConfig(
-            version=_get_env(source, "VERSION") or AdaadConfig.version,
+            version=version,
             mode=mode,
             config_schema_version=CONFIG_SCHEMA_VERSION,
             home=str(home),
             mutation_policy=MutationPolicy.LOCKED,
             planner_max_steps=1,
-            planner_max_seconds=0.01,
-            log_schema_version=_get_env(source, "LOG_SCHEMA_VERSION") or AdaadConfig.log_schema_version,
+            planner_max_seconds=_PLANNER_SECONDS_MIN,
+            log_schema_version=log_schema_version,
             log_path=log_path,
             actions_dir=actions_dir,
             ledger_enabled=True,
-            ledger_dir=_get_env(source, "LEDGER_DIR") or AdaadConfig.ledger_dir,
-            ledger_filename=_get_env(source, "LEDGER_FILE") or _get_env(source, "LEDGER_FILENAME") or AdaadConfig.ledger_filename,
-            ledger_schema_version=_get_env(source, "LEDGER_SCHEMA_VERSION")
-            or (_get_env(source, "LOG_SCHEMA_VERSION") or AdaadConfig.log_schema_version),
+            ledger_dir=ledger_dir,
+            ledger_filename=ledger_filename,
+            ledger_schema_version=ledger_schema_version,
             ledger_readonly=True,
             emergency_halt=True,
             agents_enabled=False,
             freeze_reason=reason,
-            resource_tier=_coerce_enum(_get_env(source, "RESOURCE_TIER") or "mobile", ResourceTier, "resource_tier"),
-            resource_scaling=_resource_scaling_for_tier(
-                _coerce_enum(_get_env(source, "RESOURCE_TIER") or "mobile", ResourceTier, "resource_tier")
-            ),
+            resource_tier=frozen_tier,
+            resource_scaling=_TIER_SCALING[frozen_tier],
             telemetry_exports=telemetry_exports or AdaadConfig.telemetry_exports,
         )
         cfg.validate()
         return cfg
 
     # normal load
-    version = _get_env(source, "VERSION") or AdaadConfig.version
-
     mutation_policy = _coerce_enum(
-        _get_env(source, "MUTATION_POLICY") or MutationPolicy.LOCKED.value,
+        env.get("MUTATION_POLICY") or MutationPolicy.LOCKED.value,
         MutationPolicy,
         "mutation_policy",
     )
-    readiness_gate_sig = _get_env(source, "READINESS_GATE_SIG")
+    readiness_gate_sig = env.get("READINESS_GATE_SIG")
 
-    steps_raw = _get_env(source, "PLANNER_MAX_STEPS")
-    planner_max_steps = _coerce_int(steps_raw, "planner_max_steps") if steps_raw else AdaadConfig.planner_max_steps
-
-    seconds_raw = _get_env(source, "PLANNER_MAX_SECONDS")
-    planner_max_seconds = (
-        _coerce_float(seconds_raw, "planner_max_seconds") if seconds_raw else AdaadConfig.planner_max_seconds
+    planner_max_steps = _env_int(env, "PLANNER_MAX_STEPS", "planner_max_steps", AdaadConfig.planner_max_steps)
+    planner_max_seconds = _env_float(
+        env, "PLANNER_MAX_SECONDS", "planner_max_seconds", AdaadConfig.planner_max_seconds
     )
 
-    log_schema_version = _get_env(source, "LOG_SCHEMA_VERSION") or AdaadConfig.log_schema_version
-
-    ledger_enabled_raw = _get_env(source, "LEDGER_ENABLED")
-    ledger_enabled = _coerce_bool(ledger_enabled_raw) if ledger_enabled_raw else AdaadConfig.ledger_enabled
-
-    ledger_dir = _get_env(source, "LEDGER_DIR") or AdaadConfig.ledger_dir
-    ledger_filename = (_get_env(source, "LEDGER_FILE") or _get_env(source, "LEDGER_FILENAME") or AdaadConfig.ledger_filename)
-
-    ledger_schema_version = _get_env(source, "LEDGER_SCHEMA_VERSION") or log_schema_version
-
-    ledger_readonly_raw = _get_env(source, "LEDGER_READONLY")
-    ledger_readonly = _coerce_bool(ledger_readonly_raw) if ledger_readonly_raw else False
-
-    agents_enabled_raw = _get_env(source, "AGENTS_ENABLED")
-    agents_enabled = _coerce_bool(agents_enabled_raw) if agents_enabled_raw else True
+    ledger_enabled = _env_bool(env, "LEDGER_ENABLED", AdaadConfig.ledger_enabled)
+    ledger_readonly = _env_bool(env, "LEDGER_READONLY", False)
+    cli_logging_enabled = _env_bool(env, "CLI_LOGGING_ENABLED", AdaadConfig.cli_logging_enabled)
+    ledger_batch_size = _env_int(env, "LEDGER_BATCH_SIZE", "ledger_batch_size", AdaadConfig.ledger_batch_size)
+    agents_enabled = _env_bool(env, "AGENTS_ENABLED", True)
 
-    tier = _coerce_enum(_get_env(source, "RESOURCE_TIER") or ResourceTier.MOBILE.value, ResourceTier, "resource_tier")
-    scaling = _resource_scaling_for_tier(tier)
+    tier = _coerce_enum(env.get("RESOURCE_TIER") or ResourceTier.MOBILE.value, ResourceTier, "resource_tier")
+    scaling = _TIER_SCALING[tier]
 
     # apply scaling deterministically
-    scaled_seconds = min(300.0, max(0.01, planner_max_seconds * scaling))
+    # server scaling is 1.0, but an out-of-range env value still needs the clamp
+    scaled_seconds = min(_PLANNER_SECONDS_MAX, max(_PLANNER_SECONDS_MIN, planner_max_seconds * scaling))
 
     # emergency halt dominates, even when signature OK
     if emergency_halt:
@@ -554,7 +641,7 @@ def load_config(
         agents_enabled = False
         ledger_readonly = True
         planner_max_steps = 1
-        scaled_seconds = 0.01
+        scaled_seconds = _PLANNER_SECONDS_MIN
 
     cfg = AdaadConfig(
         version=version,
@@ -570,11 +657,13 @@ def load_config(
         log_schema_version=log_schema_version,
         actions_dir=actions_dir,
         log_path=log_path,
+        cli_logging_enabled=cli_logging_enabled,
         ledger_enabled=ledger_enabled or emergency_halt,
         ledger_dir=ledger_dir,
         ledger_filename=ledger_filename,
         ledger_schema_version=ledger_schema_version,
         ledger_readonly=ledger_readonly,
+        ledger_batch_size=ledger_batch_size,
         emergency_halt=emergency_halt,
         agents_enabled=agents_enabled,
         freeze_reason="EMERGENCY_HALT" if emergency_halt else None,
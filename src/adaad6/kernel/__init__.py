@@ -1,4 +1,4 @@
-from adaad6.kernel.admissibility import is_admissible, refusal_mode
+from adaad6.kernel.admissibility import evaluate_admissibility, is_admissible, refusal_mode
 from adaad6.kernel.context import ArtifactRegistry, ConfigSnapshot, KernelContext, WorkspacePaths
 from adaad6.kernel.failures import (
     DETERMINISM_BREACH,
@@ -7,7 +7,7 @@ from adaad6.kernel.failures import (
     UNLOGGED_EXECUTION,
     KernelCrash,
 )
-from adaad6.kernel.hashing import attach_hash, canonical_json, hash_object, sha256_hex
+from adaad6.kernel.hashing import attach_hash, canonical_json, hash_excluding, hash_object, sha256_hex
 from adaad6.kernel.record import make_refusal_record
 from adaad6.kernel.vectors import VECTOR_DAG0
 
@@ -23,6 +23,8 @@ __all__ = [
     "KernelCrash",
     "attach_hash",
     "canonical_json",
+    "evaluate_admissibility",
+    "hash_excluding",
     "hash_object",
     "is_admissible",
     "refusal_mode",
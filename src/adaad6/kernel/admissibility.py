@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import Any, Callable
 
 from adaad6.kernel.failures import EVIDENCE_MISSING, INTEGRITY_VIOLATION, UNLOGGED_EXECUTION, KernelCrash
-from adaad6.kernel.hashing import hash_object
+from adaad6.kernel.hashing import hash_excluding
 from adaad6.kernel.schema import (
     validate_authority_source,
     validate_capability_token,
@@ -14,15 +14,23 @@ from adaad6.kernel.schema import (
 )
 
 Resolver = Callable[[str], dict[str, Any] | None]
+# Optional resolver.resolve_many(hashes) -> {hash: node}, for stores where one
+# lookup per node is a round-trip. Hashes absent from the result count as missing.
+BatchResolve = Callable[[list[str]], dict[str, dict[str, Any]]]
 
 
-def _resolve(resolver: Resolver, expected_hash: str, what: str) -> dict[str, Any]:
+def _resolve(
+    resolver: Resolver,
+    expected_hash: str,
+    what: str,
+    prefetched: dict[str, dict[str, Any]] | None = None,
+) -> dict[str, Any]:
     if not expected_hash:
         raise KernelCrash(EVIDENCE_MISSING, f"Missing hash for {what}")
-    node = resolver(expected_hash)
+    node = prefetched.get(expected_hash) if prefetched is not None else resolver(expected_hash)
     if node is None:
         raise KernelCrash(EVIDENCE_MISSING, f"Missing node for {what}")
-    actual_hash = hash_object({k: v for k, v in node.items() if k != "hash"})
+    actual_hash = hash_excluding(node)
     if actual_hash != expected_hash:
         raise KernelCrash(INTEGRITY_VIOLATION, f"Hash mismatch for {what}")
     return node
@@ -32,11 +40,20 @@ def _evaluate(bundle: dict[str, Any], resolver: Resolver) -> tuple[bool, str | N
     if "hash" not in bundle:
         raise KernelCrash(EVIDENCE_MISSING, "Evidence bundle missing hash")
     bundle_hash = bundle["hash"]
-    expected_bundle_hash = hash_object({k: v for k, v in bundle.items() if k != "hash"})
+    expected_bundle_hash = hash_excluding(bundle)
     if bundle_hash != expected_bundle_hash:
         raise KernelCrash(INTEGRITY_VIOLATION, "Evidence bundle hash mismatch")
 
     validate_evidence_bundle(bundle)
+    return _evaluate_nodes(bundle, resolver)
+
+
+def _evaluate_nodes(bundle: dict[str, Any], resolver: Resolver) -> tuple[bool, str | None]:
+    # Bundle-local refusal first, before any node is resolved. The gate loop below
+    # deliberately does not stop at the first FAIL: every gate and capability must
+    # still resolve and validate, or the bundle crashes instead of being refused.
+    if bundle.get("will_emit_execution_record") is not True:
+        raise KernelCrash(UNLOGGED_EXECUTION, "Execution record emission disabled")
 
     authority = _resolve(resolver, bundle["authority_hash"], "authority")
     validate_authority_source(authority)
@@ -50,23 +67,26 @@ def _evaluate(bundle: dict[str, Any], resolver: Resolver) -> tuple[bool, str | N
     validate_counterfactual_summary(counterfactual)
 
     gate_hashes = bundle.get("gate_result_hashes", [])
+    capability_hashes = bundle.get("capability_hashes", [])
+    prefetched: dict[str, dict[str, Any]] | None = None
+    resolve_many: BatchResolve | None = getattr(resolver, "resolve_many", None)
+    if resolve_many is not None:
+        wanted = [h for h in (*gate_hashes, *capability_hashes) if h]
+        prefetched = resolve_many(wanted) if wanted else {}
+
     gate_failed = False
     for gate_hash in gate_hashes:
-        gate = _resolve(resolver, gate_hash, "gate")
+        gate = _resolve(resolver, gate_hash, "gate", prefetched)
         validate_gate_result(gate)
         if gate["result"] == "FAIL":
             gate_failed = True
 
-    capability_hashes = bundle.get("capability_hashes", [])
     for cap_hash in capability_hashes:
-        token = _resolve(resolver, cap_hash, "capability token")
+        token = _resolve(resolver, cap_hash, "capability token", prefetched)
         validate_capability_token(token)
         if token.get("authority_hash") != bundle["authority_hash"]:
             raise KernelCrash(INTEGRITY_VIOLATION, "Capability token authority mismatch")
 
-    if bundle.get("will_emit_execution_record") is not True:
-        raise KernelCrash(UNLOGGED_EXECUTION, "Execution record emission disabled")
-
     refusal_mode: str | None = None
     if authority_denied:
         refusal_mode = "AUTHORITY_DENIED"
@@ -77,6 +97,11 @@ def _evaluate(bundle: dict[str, Any], resolver: Resolver) -> tuple[bool, str | N
     return admissible, refusal_mode
 
 
+def evaluate_admissibility(bundle: dict[str, Any], resolver: Resolver) -> tuple[bool, str | None]:
+    """(is_admissible, refusal_mode) from a single evaluation of the bundle."""
+    return _evaluate(bundle, resolver)
+
+
 def is_admissible(bundle: dict[str, Any], resolver: Resolver) -> bool:
     admissible, _ = _evaluate(bundle, resolver)
     return admissible
@@ -87,4 +112,4 @@ def refusal_mode(bundle: dict[str, Any], resolver: Resolver) -> str | None:
     return mode
 
 
-__all__ = ["is_admissible", "refusal_mode"]
+__all__ = ["evaluate_admissibility", "is_admissible", "refusal_mode"]
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
+from dataclasses import asdict, dataclass, field, fields
 from pathlib import Path
 from types import MappingProxyType
 from typing import Any, Mapping
 from uuid import uuid4
 
-from adaad6.config import AdaadConfig
+from adaad6.config import AdaadConfig, _traverses_symlink
 from adaad6.kernel.hashing import hash_object
 
 
@@ -17,15 +17,26 @@ def _resolve_under_home(home: Path, raw_path: str) -> str:
         rel = resolved.relative_to(home)
     except Exception as exc:
         raise ValueError("path must resolve under cfg.home") from exc
-    probe = home
-    for part in rel.parts:
-        probe = probe / part
-        if probe.exists() and probe.is_symlink():
-            raise ValueError("path must not traverse symlinks under cfg.home")
+    if _traverses_symlink(home, rel.parts):
+        raise ValueError("path must not traverse symlinks under cfg.home")
     return str(resolved)
 
 
-@dataclass(frozen=True)
+def _config_values(cfg: AdaadConfig) -> dict[str, Any]:
+    # asdict(cfg) without the deep copy: config fields are scalars, str enums and
+    # tuples of str, which asdict only copies into equal immutable values. Anything
+    # else falls back to asdict.
+    values: dict[str, Any] = {}
+    for item in fields(cfg):
+        value = getattr(cfg, item.name)
+        if not isinstance(value, (str, int, float)) and value is not None:
+            if not (type(value) is tuple and all(type(entry) is str for entry in value)):
+                return asdict(cfg)
+        values[item.name] = value
+    return values
+
+
+@dataclass(frozen=True, slots=True)
 class WorkspacePaths:
     home: str
     actions_dir: str
@@ -53,16 +64,24 @@ class WorkspacePaths:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConfigSnapshot:
     values: Mapping[str, Any]
     hash: str
 
     @classmethod
     def from_config(cls, cfg: AdaadConfig) -> "ConfigSnapshot":
-        snapshot = asdict(cfg)
+        # cfg is frozen, so its snapshot is computed once per instance. Keyed by
+        # identity, not equality: 1 == 1.0 but the two hash differently.
+        cached = cfg.__dict__.get("_config_snapshot")
+        if isinstance(cached, cls):
+            return cached
+        snapshot = _config_values(cfg)
         digest = hash_object(snapshot)
-        return cls(values=MappingProxyType(snapshot), hash=digest)
+        result = cls(values=MappingProxyType(snapshot), hash=digest)
+        # not a dataclass field: stays out of asdict/eq/repr and is not copied by replace()
+        object.__setattr__(cfg, "_config_snapshot", result)
+        return result
 
     def to_dict(self) -> dict[str, Any]:
         return {"values": dict(self.values), "hash": self.hash}
@@ -77,15 +96,26 @@ class ArtifactRegistry:
             raise ValueError("artifact name must be set")
         if not uri.strip():
             raise ValueError("artifact uri must be set")
-        if any(existing == name for existing, _ in self.artifacts):
+        names = self._names()
+        if name in names:
             raise ValueError(f"artifact {name} already registered")
-        return ArtifactRegistry(artifacts=self.artifacts + ((name, uri),))
+        registry = ArtifactRegistry(artifacts=self.artifacts + ((name, uri),))
+        object.__setattr__(registry, "_name_index", names | {name})
+        return registry
+
+    def _names(self) -> frozenset[str]:
+        # not a dataclass field: built on first lookup and handed on by register()
+        names = self.__dict__.get("_name_index")
+        if names is None:
+            names = frozenset(existing for existing, _ in self.artifacts)
+            object.__setattr__(self, "_name_index", names)
+        return names
 
     def to_dict(self) -> dict[str, str]:
         return {name: uri for name, uri in self.artifacts}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class KernelContext:
     workspace: WorkspacePaths
     run_id: str
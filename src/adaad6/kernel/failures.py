@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import traceback
+from functools import lru_cache
 from typing import Optional
 
 INTEGRITY_VIOLATION = "CRASH_0x01"
@@ -41,13 +42,19 @@ def map_exception(exc: Exception, *, include_debug: bool = False) -> KernelCrash
     detail = _exc_detail(exc)
     debug_detail = _debug_traceback(exc) if include_debug else None
 
-    if isinstance(exc, (ValueError, TypeError, PermissionError)):
-        return KernelCrash(INTEGRITY_VIOLATION, detail, debug_detail=debug_detail)
-    if isinstance(exc, (KeyError, FileNotFoundError)):
-        return KernelCrash(EVIDENCE_MISSING, detail, debug_detail=debug_detail)
-    if isinstance(exc, TimeoutError):
-        return KernelCrash(DETERMINISM_BREACH, detail, debug_detail=debug_detail)
-    return KernelCrash(DETERMINISM_BREACH, detail, debug_detail=debug_detail)
+    return KernelCrash(_crash_code(type(exc)), detail, debug_detail=debug_detail)
+
+
+@lru_cache(maxsize=64)
+def _crash_code(exc_type: type) -> str:
+    # checked in this order so exceptions deriving from several groups keep their code
+    if issubclass(exc_type, (ValueError, TypeError, PermissionError)):
+        return INTEGRITY_VIOLATION
+    if issubclass(exc_type, (KeyError, FileNotFoundError)):
+        return EVIDENCE_MISSING
+    if issubclass(exc_type, TimeoutError):
+        return DETERMINISM_BREACH
+    return DETERMINISM_BREACH
 
 
 __all__ = [
@@ -5,8 +5,13 @@ import json
 from typing import Any
 
 
+# json.dumps builds a fresh encoder per call when given options; this is the same
+# configuration, built once.
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"))
+
+
 def canonical_json(obj: Any) -> str:
-    return json.dumps(obj, sort_keys=True, separators=(",", ":"))
+    return _CANONICAL_ENCODER.encode(obj)
 
 
 def sha256_hex(value: str | bytes) -> str:
@@ -18,10 +23,21 @@ def hash_object(obj: dict[str, Any]) -> str:
     return sha256_hex(canonical_json(obj))
 
 
+def hash_excluding(obj: dict[str, Any], key: str = "hash") -> str:
+    """hash_object of obj without key, copying obj only when key is present."""
+    if key not in obj:
+        return hash_object(obj)
+    base = dict(obj)
+    del base[key]
+    return hash_object(base)
+
+
 def attach_hash(obj: dict[str, Any]) -> dict[str, Any]:
     base = dict(obj)
     base.pop("hash", None)
-    return {**base, "hash": hash_object(base)}
+    # the right-hand side is evaluated before "hash" is (re)inserted, last
+    base["hash"] = hash_object(base)
+    return base
 
 
-__all__ = ["canonical_json", "sha256_hex", "hash_object", "attach_hash"]
+__all__ = ["canonical_json", "sha256_hex", "hash_object", "hash_excluding", "attach_hash"]
@@ -5,7 +5,7 @@ from typing import Any
 from adaad6.kernel.failures import DETERMINISM_BREACH, EVIDENCE_MISSING, INTEGRITY_VIOLATION, KernelCrash
 
 
-def _require_fields(obj: dict[str, Any], fields: list[str]) -> None:
+def _require_fields(obj: dict[str, Any], fields: tuple[str, ...]) -> None:
     for field in fields:
         if field not in obj:
             raise KernelCrash(EVIDENCE_MISSING, f"Missing required field: {field}")
@@ -17,7 +17,7 @@ def _ensure_type(value: Any, expected_type: type, field: str, code: str = INTEGR
 
 
 def validate_authority_source(obj: dict[str, Any]) -> None:
-    _require_fields(obj, ["type", "version", "authority_domain", "scope", "mandate"])
+    _require_fields(obj, ("type", "version", "authority_domain", "scope", "mandate"))
     if obj.get("type") != "AuthoritySource":
         raise KernelCrash(INTEGRITY_VIOLATION, "Invalid authority source type")
     # authority_domain is the liability domain identifier
@@ -34,17 +34,17 @@ def validate_authority_source(obj: dict[str, Any]) -> None:
 
 
 def validate_proposal(obj: dict[str, Any]) -> None:
-    _require_fields(obj, ["type", "version", "proposal_kind"])
+    _require_fields(obj, ("type", "version", "proposal_kind"))
     if obj.get("type") != "Proposal":
         raise KernelCrash(INTEGRITY_VIOLATION, "Invalid proposal type")
     proposal_kind = obj.get("proposal_kind")
     if proposal_kind == "adapter_call":
-        required = ["adapter", "intent", "inputs", "requested_effects", "counterfactual_budget"]
+        required = ("adapter", "intent", "inputs", "requested_effects", "counterfactual_budget")
         _require_fields(obj, required)
 
 
 def validate_gate_result(obj: dict[str, Any]) -> None:
-    _require_fields(obj, ["type", "version", "gate_id", "result", "deterministic"])
+    _require_fields(obj, ("type", "version", "gate_id", "result", "deterministic"))
     if obj.get("type") != "GateResult":
         raise KernelCrash(INTEGRITY_VIOLATION, "Invalid gate result type")
     result = obj.get("result")
@@ -55,48 +55,52 @@ def validate_gate_result(obj: dict[str, Any]) -> None:
 
 
 def validate_capability_token(obj: dict[str, Any]) -> None:
-    _require_fields(obj, ["type", "version", "authority_hash", "decay_only", "limits", "scopes"])
+    _require_fields(obj, ("type", "version", "authority_hash", "decay_only", "limits", "scopes"))
     if obj.get("type") != "CapabilityToken":
         raise KernelCrash(INTEGRITY_VIOLATION, "Invalid capability token type")
-    _ensure_type(obj.get("authority_hash"), str, "authority_hash")
-    _ensure_type(obj.get("decay_only"), bool, "decay_only")
-    if obj.get("decay_only") is not True:
+    _ensure_type(obj["authority_hash"], str, "authority_hash")
+    decay_only = obj["decay_only"]
+    _ensure_type(decay_only, bool, "decay_only")
+    if decay_only is not True:
         raise KernelCrash(INTEGRITY_VIOLATION, "decay_only must be True")
-    _ensure_type(obj.get("limits"), dict, "limits")
-    limits = obj.get("limits") or {}
+    limits = obj["limits"]
+    _ensure_type(limits, dict, "limits")
     if "expires_at" not in limits or "max_calls" not in limits:
         raise KernelCrash(EVIDENCE_MISSING, "limits missing required fields")
     _ensure_type(limits["expires_at"], str, "limits.expires_at")
     _ensure_type(limits["max_calls"], int, "limits.max_calls")
     if limits["max_calls"] < 1:
         raise KernelCrash(INTEGRITY_VIOLATION, "limits.max_calls must be >= 1")
-    _ensure_type(obj.get("scopes"), list, "scopes")
-    if not obj["scopes"]:
+    scopes = obj["scopes"]
+    _ensure_type(scopes, list, "scopes")
+    if not scopes:
         raise KernelCrash(INTEGRITY_VIOLATION, "scopes must be non-empty")
-    for scope in obj["scopes"]:
+    for scope in scopes:
         _ensure_type(scope, str, "scopes[]")
 
 
 def validate_counterfactual_summary(obj: dict[str, Any]) -> None:
-    _require_fields(obj, ["type", "version", "budget", "rejected", "unlisted_commitment"])
+    _require_fields(obj, ("type", "version", "budget", "rejected", "unlisted_commitment"))
     if obj.get("type") != "CounterfactualSummary":
         raise KernelCrash(INTEGRITY_VIOLATION, "Invalid counterfactual summary type")
-    _ensure_type(obj.get("budget"), int, "budget")
-    if obj["budget"] < 0:
+    budget = obj["budget"]
+    _ensure_type(budget, int, "budget")
+    if budget < 0:
         raise KernelCrash(INTEGRITY_VIOLATION, "budget must be non-negative")
-    _ensure_type(obj.get("rejected"), list, "rejected")
-    if len(obj["rejected"]) > obj["budget"]:
+    rejected = obj["rejected"]
+    _ensure_type(rejected, list, "rejected")
+    if len(rejected) > budget:
         raise KernelCrash(INTEGRITY_VIOLATION, "rejected count exceeds budget")
-    for item in obj["rejected"]:
+    for item in rejected:
         _ensure_type(item, dict, "rejected[]")
-        _require_fields(item, ["alt", "reason"])
+        _require_fields(item, ("alt", "reason"))
         _ensure_type(item.get("alt"), str, "rejected[].alt")
         _ensure_type(item.get("reason"), str, "rejected[].reason")
     _ensure_type(obj.get("unlisted_commitment"), str, "unlisted_commitment")
 
 
 def validate_evidence_bundle(obj: dict[str, Any]) -> None:
-    required = [
+    required = (
         "type",
         "version",
         "authority_hash",
@@ -105,7 +109,7 @@ def validate_evidence_bundle(obj: dict[str, Any]) -> None:
         "capability_hashes",
         "counterfactual_hash",
         "will_emit_execution_record",
-    ]
+    )
     _require_fields(obj, required)
     if obj.get("type") != "EvidenceBundle":
         raise KernelCrash(INTEGRITY_VIOLATION, "Invalid evidence bundle type")
@@ -118,7 +122,7 @@ def validate_evidence_bundle(obj: dict[str, Any]) -> None:
 def validate_execution_record(obj: dict[str, Any]) -> None:
     _require_fields(
         obj,
-        ["type", "version", "evidence_bundle_hash", "outcome", "reason", "refusal_mode"],
+        ("type", "version", "evidence_bundle_hash", "outcome", "reason", "refusal_mode"),
     )
     if obj.get("type") != "ExecutionRecord":
         raise KernelCrash(INTEGRITY_VIOLATION, "Invalid execution record type")
@@ -126,7 +130,7 @@ def validate_execution_record(obj: dict[str, Any]) -> None:
     if refusal_mode not in ("AUTHORITY_DENIED", "GATE_FAIL"):
         raise KernelCrash(INTEGRITY_VIOLATION, "Invalid refusal_mode")
     if refusal_mode == "GATE_FAIL":
-        _require_fields(obj, ["failed_gate_id"])
+        _require_fields(obj, ("failed_gate_id",))
         if not obj.get("failed_gate_id"):
             raise KernelCrash(INTEGRITY_VIOLATION, "failed_gate_id required for GATE_FAIL")
     else:
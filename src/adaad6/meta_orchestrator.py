@@ -1,11 +1,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Callable, Mapping
 
-from adaad6.assurance.logging import canonical_json, compute_checksum
+from adaad6.assurance.logging import canonical_json, compute_checksum, utc_now_iso_z
 from adaad6.config import AdaadConfig, enforce_readiness_gate
 from adaad6.planning.actions import builtin_action_names
 from adaad6.provenance.ledger import append_event
@@ -23,7 +22,7 @@ PlanFactory = Callable[[str, AdaadConfig], "Plan"]
 ActionBuilder = Callable[[AdaadConfig], Mapping[str, "ActionModule"]]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OrchestratorResult:
     ok: bool
     config: AdaadConfig
@@ -40,7 +39,7 @@ class OrchestratorResult:
             raise ValueError("failure_reason must be set when ok=False")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ArchetypePolicy:
     name: str
     action_filter: Callable[[dict[str, "ActionModule"], AdaadConfig], dict[str, "ActionModule"]]
@@ -58,10 +57,6 @@ _ALLOWED_MONETIZER_PREFIXES = (
 )
 
 
-def _utc_now_iso_z() -> str:
-    return datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
-
-
 def register_archetype(name: str, policy: ArchetypePolicy) -> ArchetypePolicy:
     key = name.strip().lower()
     if not key:
@@ -107,7 +102,7 @@ def _monetizer_start(cfg: AdaadConfig, goal: str, plan: "Plan") -> None:
     if not cfg.ledger_enabled:
         return
     payload = {"archetype": "monetizer", "stage": "start", "goal": goal, "plan": [step.to_dict() for step in plan.steps]}
-    append_event(cfg, "monetizer_run_start", _hashed_payload(payload), _utc_now_iso_z(), actor="monetizer")
+    append_event(cfg, "monetizer_run_start", _hashed_payload(payload), utc_now_iso_z(), actor="monetizer")
 
 
 def _monetizer_complete(cfg: AdaadConfig, goal: str, log: "ExecutionLog | None") -> None:
@@ -120,7 +115,7 @@ def _monetizer_complete(cfg: AdaadConfig, goal: str, log: "ExecutionLog | None")
         "ok": log.ok if log else False,
         "run_id": log.context.run_id if log else None,
     }
-    append_event(cfg, "monetizer_run_complete", _hashed_payload(payload), _utc_now_iso_z(), actor="monetizer")
+    append_event(cfg, "monetizer_run_complete", _hashed_payload(payload), utc_now_iso_z(), actor="monetizer")
 
 
 _MONETIZER_ARCHETYPE = ArchetypePolicy(
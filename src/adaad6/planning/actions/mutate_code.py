@@ -10,11 +10,11 @@ try:  # pragma: no cover - platform dependent
 except ImportError:  # pragma: no cover - platform dependent
     resource = None
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from pathlib import Path
 from types import MappingProxyType
 from typing import Any, Mapping
 
+from adaad6.assurance.logging import utc_now_iso_z
 from adaad6.config import AdaadConfig, MutationPolicy, ResourceTier, enforce_readiness_gate
 from adaad6.provenance.ledger import append_event, ensure_ledger
 from adaad6.runtime.gates import EvidenceStore, cryovant_lineage_gate
@@ -104,10 +104,6 @@ class MutationReport:
         }
 
 
-def _utc_now_iso_z() -> str:
-    return datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
-
-
 def _coerce_source(raw: Any) -> str:
     if not isinstance(raw, str):
         raise ValueError("src must be a string")
@@ -258,7 +254,7 @@ def _record_ledger(cfg: AdaadConfig, payload: dict[str, Any]) -> Mapping[str, An
             cfg=cfg,
             event_type="mutation_attempt",
             payload=payload,
-            ts=_utc_now_iso_z(),
+            ts=utc_now_iso_z(),
             actor="mutate_code",
         )
         return {"event_id": event.get("event_id"), "hash": event.get("hash")}
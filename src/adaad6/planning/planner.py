@@ -125,7 +125,7 @@ class Plan:
 
 
 def make_plan(goal: str, cfg: AdaadConfig) -> Plan:
-    cfg.validate()
+    cfg.validate_once()
     start = _now()
     meta: dict[str, Any] = {"truncated": False, "time_capped": False, "tier": cfg.resource_tier.value}
 
@@ -1,8 +1,21 @@
 from adaad6.provenance.hashchain import compute_event_hash, verify_chain
-from adaad6.provenance.ledger import append_event, ensure_ledger, ledger_path, read_events
+from adaad6.provenance.ledger import (
+    LedgerBatchWriter,
+    LedgerEntry,
+    LedgerWriteError,
+    append_event,
+    append_events,
+    ensure_ledger,
+    ledger_path,
+    read_events,
+)
 
 __all__ = [
+    "LedgerBatchWriter",
+    "LedgerEntry",
+    "LedgerWriteError",
     "append_event",
+    "append_events",
     "compute_event_hash",
     "ensure_ledger",
     "ledger_path",
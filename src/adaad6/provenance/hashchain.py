@@ -1,24 +1,33 @@
 from __future__ import annotations
 
 import hashlib
-from typing import Any, Iterable
+from typing import Any, Iterable, Mapping
 
-from adaad6.assurance.logging import canonical_json
+from adaad6.assurance.logging import canonical_json_bytes, canonical_json_splice
 
 
-def compute_event_hash(event_without_hash: dict[str, Any]) -> str:
-    encoded = canonical_json(event_without_hash).encode("utf-8")
+def compute_event_hash_bytes(encoded: bytes) -> str:
     return hashlib.sha256(encoded).hexdigest()
 
 
+def compute_event_hash(event_without_hash: dict[str, Any], encoded: Mapping[str, bytes] | None = None) -> str:
+    """
+    Hash of the event's canonical JSON. ``encoded`` holds further fields that are
+    already canonical JSON bytes (e.g. the payload); they are spliced in as-is.
+    """
+    if encoded:
+        return compute_event_hash_bytes(canonical_json_splice(event_without_hash, encoded))
+    return compute_event_hash_bytes(canonical_json_bytes(event_without_hash))
+
+
 def verify_chain(events: Iterable[dict[str, Any]]) -> bool:
     prev_hash: str | None = None
     for event in events:
         expected_prev = prev_hash
-        current = dict(event)
-        current_hash = current.pop("hash", None)
+        current_hash = event.get("hash")
         if current_hash is None:
             return False
+        current = {key: value for key, value in event.items() if key != "hash"}
         if current.get("prev_hash") != expected_prev:
             return False
         if compute_event_hash(current) != current_hash:
@@ -27,4 +36,4 @@ def verify_chain(events: Iterable[dict[str, Any]]) -> bool:
     return True
 
 
-__all__ = ["compute_event_hash", "verify_chain"]
+__all__ = ["compute_event_hash", "compute_event_hash_bytes", "verify_chain"]
@@ -1,12 +1,23 @@
 from __future__ import annotations
 
-import json
+import atexit
 import os
+import sys
+import threading
+import time
+import weakref
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable
 from uuid import uuid4
 
-from adaad6.assurance.logging import canonical_json
+from adaad6.assurance.logging import (
+    PartialAppendError,
+    append_bytes,
+    canonical_json_bytes,
+    canonical_json_splice,
+    parse_json,
+)
 from adaad6.config import AdaadConfig
 from adaad6.provenance.hashchain import compute_event_hash
 
@@ -44,31 +55,189 @@ def _last_hash(path: Path) -> str | None:
                 last_line = line
     if not last_line:
         return None
-    last_event = json.loads(last_line)
+    last_event = parse_json(last_line)
     return last_event.get("hash")
 
 
-def append_event(cfg: AdaadConfig, event_type: str, payload: dict[str, Any], ts: str, actor: str) -> dict[str, Any]:
-    if cfg.ledger_readonly:
-        raise RuntimeError("LEDGER_READONLY")
+@dataclass(frozen=True)
+class LedgerEntry:
+    event_type: str
+    payload: dict[str, Any]
+    ts: str
+    actor: str
+    # canonical_json(payload) as UTF-8 bytes, when the caller already has it
+    payload_canonical: bytes | None = None
 
-    path = ensure_ledger(cfg)
-    prev_hash = _last_hash(path)
-    event_without_hash = {
+
+def _chain_entry(cfg: AdaadConfig, entry: LedgerEntry, prev_hash: str | None) -> tuple[dict[str, Any], bytes]:
+    fields = {
         "schema_version": cfg.ledger_schema_version,
         "event_id": str(uuid4()),
-        "ts": ts,
-        "actor": actor,
-        "type": event_type,
-        "payload": payload,
+        "ts": entry.ts,
+        "actor": entry.actor,
+        "type": entry.event_type,
         "prev_hash": prev_hash,
     }
-    event_hash = compute_event_hash(event_without_hash)
-    event = dict(event_without_hash, hash=event_hash)
-    serialized = canonical_json(event)
-    with path.open("a", encoding="utf-8") as handle:
-        handle.write(serialized + "\n")
-    return event
+    encoded = {"payload": entry.payload_canonical or canonical_json_bytes(entry.payload)}
+    event_hash = compute_event_hash(fields, encoded)
+    serialized = canonical_json_splice({**fields, "hash": event_hash}, encoded)
+    return dict(fields, payload=entry.payload, hash=event_hash), serialized + b"\n"
+
+
+class LedgerWriteError(RuntimeError):
+    """An append_events write failed after the events in ``written`` reached the ledger."""
+
+    def __init__(self, written: list[dict[str, Any]], total: int) -> None:
+        super().__init__(f"ledger append failed after {len(written)} of {total} events")
+        self.written = written
+
+
+def append_events(cfg: AdaadConfig, entries: Iterable[LedgerEntry]) -> list[dict[str, Any]]:
+    """
+    Append several entries as one hash-chained write.
+
+    The ledger is checked, its last hash read and the file opened once per batch
+    rather than once per event. If the write fails part way, LedgerWriteError lists
+    the events whose lines were written in full.
+    """
+    if cfg.ledger_readonly:
+        raise RuntimeError("LEDGER_READONLY")
+
+    path = ensure_ledger(cfg)
+    prev_hash = _last_hash(path)
+    events: list[dict[str, Any]] = []
+    lines: list[bytes] = []
+    for entry in entries:
+        event, line = _chain_entry(cfg, entry, prev_hash)
+        prev_hash = event["hash"]
+        events.append(event)
+        lines.append(line)
+    if lines:
+        try:
+            append_bytes(path, b"".join(lines))
+        except PartialAppendError as exc:
+            landed = end = 0
+            for line in lines:
+                end += len(line)
+                if end > exc.written:
+                    break
+                landed += 1
+            raise LedgerWriteError(events[:landed], len(events)) from exc
+    return events
+
+
+def append_event(
+    cfg: AdaadConfig,
+    event_type: str,
+    payload: dict[str, Any],
+    ts: str,
+    actor: str,
+    *,
+    payload_canonical: bytes | None = None,
+) -> dict[str, Any]:
+    """
+    Append a hash-chained event to the ledger.
+
+    payload_canonical, when given, must be canonical_json(payload) as UTF-8 bytes; it is
+    spliced into the event instead of re-serializing the payload for the hash and the line.
+    """
+    entry = LedgerEntry(event_type=event_type, payload=payload, ts=ts, actor=actor, payload_canonical=payload_canonical)
+    return append_events(cfg, [entry])[0]
+
+
+class LedgerBatchWriter:
+    """
+    Buffers ledger entries and appends them with append_events.
+
+    A batch is written when it reaches max_events, when its oldest entry is older
+    than max_delay_s (checked on enqueue; there is no background timer), or on
+    flush(). Pending entries are not on disk until then, so callers must flush (or
+    use the writer as a context manager) before relying on the ledger contents.
+    Anything still pending at interpreter exit is flushed as a last resort, and a
+    failure there is reported on stderr.
+    """
+
+    def __init__(
+        self,
+        cfg: AdaadConfig,
+        *,
+        max_events: int | None = None,
+        max_delay_s: float = 0.005,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.cfg = cfg
+        self.max_events = max(1, max_events if max_events is not None else cfg.ledger_batch_size)
+        self.max_delay_s = max_delay_s
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._pending: list[LedgerEntry] = []
+        self._oldest: float | None = None
+        _LIVE_WRITERS.add(self)
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def enqueue(
+        self,
+        event_type: str,
+        payload: dict[str, Any],
+        ts: str,
+        actor: str,
+        *,
+        payload_canonical: bytes | None = None,
+    ) -> list[dict[str, Any]]:
+        """Queue an entry; returns the written events if this call triggered a flush."""
+        if self.cfg.ledger_readonly:
+            raise RuntimeError("LEDGER_READONLY")
+        entry = LedgerEntry(event_type=event_type, payload=payload, ts=ts, actor=actor, payload_canonical=payload_canonical)
+        with self._lock:
+            now = self._clock()
+            if self._oldest is None:
+                self._oldest = now
+            self._pending.append(entry)
+            if len(self._pending) >= self.max_events or now - self._oldest >= self.max_delay_s:
+                return self._flush_locked()
+        return []
+
+    def flush(self) -> list[dict[str, Any]]:
+        with self._lock:
+            return self._flush_locked()
+
+    def _flush_locked(self) -> list[dict[str, Any]]:
+        if not self._pending:
+            return []
+        # unwritten entries stay queued if the write fails so the next flush retries
+        # them; entries that already reached the ledger are dropped, not duplicated
+        try:
+            events = append_events(self.cfg, self._pending)
+        except LedgerWriteError as exc:
+            del self._pending[: len(exc.written)]
+            raise
+        self._pending, self._oldest = [], None
+        return events
+
+    def __enter__(self) -> "LedgerBatchWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.flush()
+
+
+# Writers still alive at exit; the atexit hook flushes whatever they hold so
+# callers that forgot to flush do not lose buffered events silently.
+_LIVE_WRITERS: "weakref.WeakSet[LedgerBatchWriter]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_writers() -> None:
+    for writer in list(_LIVE_WRITERS):
+        pending = writer.pending
+        try:
+            writer.flush()
+        except Exception as exc:
+            sys.stderr.write(f"adaad6: failed to flush {pending} pending ledger events: {exc}\n")
+            sys.stderr.flush()
 
 
 def read_events(cfg: AdaadConfig, limit: int | None = None) -> list[dict[str, Any]]:
@@ -80,10 +249,19 @@ def read_events(cfg: AdaadConfig, limit: int | None = None) -> list[dict[str, An
         for line in handle:
             if not line.strip():
                 continue
-            events.append(json.loads(line))
+            events.append(parse_json(line))
     if limit is None:
         return events
     return events[-limit:]
 
 
-__all__ = ["append_event", "ensure_ledger", "ledger_path", "read_events"]
+__all__ = [
+    "LedgerBatchWriter",
+    "LedgerEntry",
+    "LedgerWriteError",
+    "append_event",
+    "append_events",
+    "ensure_ledger",
+    "ledger_path",
+    "read_events",
+]
@@ -3,12 +3,11 @@ from __future__ import annotations
 import hashlib
 import json
 from dataclasses import dataclass
-from datetime import datetime, timezone
 import sys
 from typing import Any, Callable, Iterable, Mapping, Sequence
 from urllib.parse import quote
 
-from adaad6.assurance.logging import canonical_json, compute_checksum
+from adaad6.assurance.logging import canonical_json, compute_checksum, utc_now_iso_z
 from adaad6.config import AdaadConfig, MutationPolicy, enforce_readiness_gate
 from adaad6.kernel.failures import (
     EVIDENCE_MISSING,
@@ -208,10 +207,6 @@ def _artifact_uri(output: Any) -> str:
     return f"data:application/json,{quote(serialized, safe='')}"
 
 
-def _utc_now_iso_z() -> str:
-    return datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
-
-
 def _payload_with_content_hash(payload: dict[str, Any]) -> dict[str, Any]:
     base = dict(payload)
     base_without_hash = {k: v for k, v in base.items() if k != "content_hash"}
@@ -220,14 +215,15 @@ def _payload_with_content_hash(payload: dict[str, Any]) -> dict[str, Any]:
     return base
 
 
+_MUTATION_ACTIONS = frozenset({"mutate_code", "mutate", "evolve", "autopromote", "autonomous_mutation"})
+_MUTATION_EFFECTS = frozenset({"mutation", "evolution"})
+
+
 def _requires_lineage_gate(plan: Sequence[ActionSpec] | Iterable[ActionSpec]) -> bool:
-    mutation_actions = {"mutate_code", "mutate", "evolve", "autopromote", "autonomous_mutation"}
-    mutation_effects = {"mutation", "evolution"}
     for spec in plan:
-        if spec.action in mutation_actions:
+        if spec.action in _MUTATION_ACTIONS:
             return True
-        effects = tuple(spec.effects or ())
-        if mutation_effects.intersection(set(effects)):
+        if not _MUTATION_EFFECTS.isdisjoint(spec.effects or ()):
             return True
     return False
 
@@ -354,12 +350,12 @@ def execute_plan(
     lineage_hash: str | None = None,
     gate_result: LineageGateResult | None = None,
 ) -> ExecutionLog:
-    cfg.validate()
+    cfg.validate_once()
     original_policy = cfg.mutation_policy
     cfg, readiness_ok, readiness_reason = enforce_readiness_gate(cfg)
     if original_policy == MutationPolicy.EVOLUTIONARY and not readiness_ok:
         raise RuntimeError(f"Readiness gate failed: {readiness_reason}")
-    cfg.validate()
+    cfg.validate_once()  # no-op unless the readiness gate returned a new (frozen) config
     plan_items = tuple(plan)
     _enforce_lineage_gate(plan_items, cfg, evidence_store=evidence_store, lineage_hash=lineage_hash, gate_result=gate_result)
     context = ctx or KernelContext.build(cfg)
@@ -379,12 +375,12 @@ def execute_and_record(
     lineage_hash: str | None = None,
     gate_result: LineageGateResult | None = None,
 ) -> ExecutionLog:
-    cfg.validate()
+    cfg.validate_once()
     original_policy = cfg.mutation_policy
     cfg, readiness_ok, readiness_reason = enforce_readiness_gate(cfg)
     if original_policy == MutationPolicy.EVOLUTIONARY and not readiness_ok:
         raise RuntimeError(f"Readiness gate failed: {readiness_reason}")
-    cfg.validate()
+    cfg.validate_once()  # no-op unless the readiness gate returned a new (frozen) config
     plan_items = tuple(plan)
     _enforce_lineage_gate(plan_items, cfg, evidence_store=evidence_store, lineage_hash=lineage_hash, gate_result=gate_result)
     context = ctx or KernelContext.build(cfg)
@@ -406,7 +402,7 @@ def execute_and_record(
     }
 
     def _append_hashed_event(event_type: str, payload: dict[str, Any]) -> dict[str, Any]:
-        return append_event(cfg, event_type, _payload_with_content_hash(payload), _utc_now_iso_z(), actor)
+        return append_event(cfg, event_type, _payload_with_content_hash(payload), utc_now_iso_z(), actor)
 
     try:
         _append_hashed_event("execution_run_start", start_payload)
@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Mapping
 
-from adaad6.kernel.hashing import hash_object
+from adaad6.kernel.hashing import hash_excluding, hash_object
 
 
 @dataclass(frozen=True)
@@ -38,7 +38,7 @@ class EvidenceStore:
         node = self._lineages.get(lineage_hash)
         if node is None:
             return None
-        expected = hash_object({k: v for k, v in node.items() if k != "hash"})
+        expected = hash_excluding(node)
         if node.get("hash") != expected or lineage_hash != expected:
             return None
         return dict(node)
@@ -54,7 +54,7 @@ def cryovant_lineage_gate(
     lineage = evidence_store.resolve_lineage(lineage_hash)
     if lineage is None:
         return LineageGateResult(False, "cryovant_lineage_unknown", lineage_hash)
-    expected = hash_object({k: v for k, v in lineage.items() if k != "hash"})
+    expected = hash_excluding(lineage)
     if expected != lineage_hash:
         return LineageGateResult(False, "cryovant_lineage_hash_mismatch", lineage_hash)
     return LineageGateResult(True, None, lineage_hash)
@@ -250,15 +250,16 @@ def check_structure_details(cfg: AdaadConfig | None = None) -> dict[str, Any]:
     if not ledger_dirs_ok:
         ledger_feed_ok = False
 
+    # keys are kept in sorted order; doctor reports rely on it instead of re-sorting
     return {
-        "structure": structure_ok,
         "ledger_dirs": ledger_dirs_ok,
         "ledger_dirs_error": ledger_error,
         "ledger_feed": ledger_feed_ok,
         "ledger_feed_error": ledger_feed_error,
         "ledger_feed_path": str(ledger_feed_path) if ledger_feed_path else None,
-        "telemetry_ok": telemetry_exports_ok,
+        "structure": structure_ok,
         "telemetry_exports": telemetry_exports,
+        "telemetry_ok": telemetry_exports_ok,
         "tree_law": tree_law_ok,
         "tree_law_error": tree_law_error,
     }
@@ -3,9 +3,10 @@ from pathlib import Path
 from tempfile import TemporaryDirectory
 
 from adaad6.adapters.base import AdapterResult, BaseAdapter
-from adaad6.assurance.logging import compute_checksum
+from adaad6.assurance.logging import canonical_json, compute_checksum
 from adaad6.config import AdaadConfig
-from adaad6.provenance.ledger import read_events
+from adaad6.provenance.hashchain import verify_chain
+from adaad6.provenance.ledger import ledger_path, read_events
 
 
 class EchoAdapter(BaseAdapter):
@@ -47,6 +48,47 @@ class AdapterLedgerWriteTest(unittest.TestCase):
             self.assertEqual(expected_payload["checksum"], compute_checksum(checksum_payload))
             self.assertEqual(result.log["ledger_event_hash"], event["hash"])
 
+    def test_spliced_ledger_lines_are_canonical_and_chained(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            cfg = AdaadConfig(ledger_enabled=True, home=tmpdir)
+            adapter = EchoAdapter()
+            for idx in range(3):
+                adapter.run(intent="echo", inputs={"n": idx, "s": "\u00e9"}, actor="tester", cfg=cfg)
+
+            events = read_events(cfg)
+            lines = ledger_path(cfg).read_text(encoding="utf-8").splitlines()
+            self.assertEqual(lines, [canonical_json(event) for event in events])
+            self.assertTrue(verify_chain(events))
+
+    def test_batched_adapter_calls_defer_ledger_writes(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            cfg = AdaadConfig(ledger_enabled=True, home=tmpdir, ledger_batch_size=2)
+            adapter = EchoAdapter()
+            first = adapter.run(intent="echo", inputs={"n": 1}, actor="tester", cfg=cfg, now_fn=lambda: "t")
+            self.assertTrue(first.log["ledger_pending"])
+            self.assertFalse(first.log["ledger_appended"])
+            self.assertEqual(read_events(cfg), [])
+
+            second = adapter.run(intent="echo", inputs={"n": 2}, actor="tester", cfg=cfg, now_fn=lambda: "t")
+            self.assertTrue(second.log["ledger_appended"])
+            self.assertFalse(second.log["ledger_pending"])
+            events = read_events(cfg)
+            self.assertEqual([event["payload"]["inputs"]["n"] for event in events], [1, 2])
+            self.assertEqual(second.log["ledger_event_hash"], events[-1]["hash"])
+
+            adapter.run(intent="echo", inputs={"n": 3}, actor="tester", cfg=cfg, now_fn=lambda: "t")
+            self.assertEqual(len(adapter.flush_ledger()), 1)
+            self.assertTrue(verify_chain(read_events(cfg)))
+
+            adapter.run(intent="echo", inputs={"n": 4}, actor="tester", cfg=cfg, now_fn=lambda: "t")
+            adapter.close()
+            self.assertEqual([1, 2, 3, 4], [event["payload"]["inputs"]["n"] for event in read_events(cfg)])
+
+            with EchoAdapter() as scoped:
+                scoped.run(intent="echo", inputs={"n": 5}, actor="tester", cfg=cfg, now_fn=lambda: "t")
+                self.assertEqual(4, len(read_events(cfg)))
+            self.assertEqual([1, 2, 3, 4, 5], [event["payload"]["inputs"]["n"] for event in read_events(cfg)])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -9,8 +9,9 @@ from adaad6.kernel import (
     KernelCrash,
     VECTOR_DAG0,
     attach_hash,
+    hash_excluding,
 )
-from adaad6.kernel.admissibility import is_admissible, refusal_mode
+from adaad6.kernel.admissibility import evaluate_admissibility, is_admissible, refusal_mode
 from adaad6.kernel.record import make_refusal_record
 
 
@@ -42,6 +43,21 @@ class AdmissibilityVectorsTest(unittest.TestCase):
             is_admissible(bundle, self._resolver(self.nodes))
         self.assertEqual(ctx.exception.code, UNLOGGED_EXECUTION)
 
+    def test_missing_execution_record_flag_crashes_before_resolving(self) -> None:
+        bundle = copy.deepcopy(self.bundle)
+        bundle["will_emit_execution_record"] = False
+        bundle = attach_hash({k: v for k, v in bundle.items() if k != "hash"})
+        lookups: list[str] = []
+
+        def resolver(node_hash):
+            lookups.append(node_hash)
+            return self.nodes.get(node_hash)
+
+        with self.assertRaises(KernelCrash) as ctx:
+            is_admissible(bundle, resolver)
+        self.assertEqual(ctx.exception.code, UNLOGGED_EXECUTION)
+        self.assertEqual([], lookups)
+
     def test_gate_with_invalid_result_crashes(self) -> None:
         nodes = dict(self.nodes)
         bad_gate = copy.deepcopy(self.vector["gate_results"][0])
@@ -123,5 +139,71 @@ class AdmissibilityVectorsTest(unittest.TestCase):
         self.assertEqual(mode, "AUTHORITY_DENIED")
 
 
+    def test_evaluate_admissibility_resolves_each_node_once(self) -> None:
+        lookups: list[str] = []
+
+        def resolver(node_hash):
+            lookups.append(node_hash)
+            return self.nodes.get(node_hash)
+
+        self.assertEqual((False, "AUTHORITY_DENIED"), evaluate_admissibility(self.bundle, resolver))
+        self.assertEqual(len(set(lookups)), len(lookups))
+
+    def test_repeat_evaluation_sees_tampered_store(self) -> None:
+        nodes = dict(self.nodes)
+        resolver = nodes.get
+        self.assertEqual(refusal_mode(self.bundle, resolver), "AUTHORITY_DENIED")
+
+        authority_hash = self.bundle["authority_hash"]
+        nodes[authority_hash] = {**nodes[authority_hash], "mandate": "tampered"}
+        for check in (is_admissible, refusal_mode):
+            with self.assertRaises(KernelCrash) as ctx:
+                check(self.bundle, resolver)
+            self.assertEqual(ctx.exception.code, INTEGRITY_VIOLATION)
+
+    def test_hash_excluding_matches_attach_hash(self) -> None:
+        bundle = copy.deepcopy(self.bundle)
+        self.assertEqual(bundle["hash"], hash_excluding(bundle))
+        self.assertIn("hash", bundle)
+        unhashed = {k: v for k, v in bundle.items() if k != "hash"}
+        self.assertEqual(attach_hash(unhashed)["hash"], hash_excluding(unhashed))
+
+    def test_attach_hash_replaces_stale_hash_without_touching_input(self) -> None:
+        stale = {"hash": "stale", "type": "Proposal", "version": "1"}
+        hashed = attach_hash(stale)
+
+        self.assertEqual("stale", stale["hash"])
+        self.assertEqual(["type", "version", "hash"], list(hashed))
+        self.assertEqual(hashed["hash"], hash_excluding(stale))
+
+    def test_batch_resolver_fetches_gates_and_capabilities_once(self) -> None:
+        nodes = self.nodes
+
+        class BatchResolver:
+            def __init__(self, available):
+                self.available = available
+                self.single: list[str] = []
+                self.batches: list[list[str]] = []
+
+            def __call__(self, node_hash):
+                self.single.append(node_hash)
+                return self.available.get(node_hash)
+
+            def resolve_many(self, hashes):
+                self.batches.append(list(hashes))
+                return {h: self.available[h] for h in hashes if h in self.available}
+
+        resolver = BatchResolver(nodes)
+        self.assertEqual(refusal_mode(self.bundle, resolver), "AUTHORITY_DENIED")
+        expected = self.bundle["gate_result_hashes"] + self.bundle["capability_hashes"]
+        self.assertEqual([expected], resolver.batches)
+        self.assertEqual(3, len(resolver.single))
+
+        missing_gate = self.bundle["gate_result_hashes"][0]
+        partial = BatchResolver({k: v for k, v in nodes.items() if k != missing_gate})
+        with self.assertRaises(KernelCrash) as ctx:
+            is_admissible(self.bundle, partial)
+        self.assertEqual(ctx.exception.code, EVIDENCE_MISSING)
+
 if __name__ == "__main__":
     unittest.main()
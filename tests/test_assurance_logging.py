@@ -1,9 +1,26 @@
 import json
+import os
+import threading
 import unittest
+import uuid
+from datetime import datetime
+from enum import Enum, IntEnum
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from unittest.mock import patch
 
-from adaad6.assurance.logging import append_jsonl_log_event, canonical_json, log_path
+from adaad6.assurance.logging import (
+    append_jsonl_log_event,
+    build_log_event,
+    canonical_json,
+    canonical_json_bytes,
+    canonical_json_line,
+    canonical_json_splice,
+    compute_checksum,
+    flush_log,
+    log_path,
+    parse_json,
+)
 from adaad6.config import AdaadConfig
 
 
@@ -31,7 +48,25 @@ class AssuranceLoggingTest(unittest.TestCase):
             self.assertEqual(loaded["action"], "boot")
             self.assertEqual(loaded["outcome"], "ok")
             self.assertEqual(loaded["details"], {"a": 1, "b": 2})
-            self.assertIn("checksum", loaded)
+            self.assertEqual(loaded["checksum"], compute_checksum({k: v for k, v in loaded.items() if k != "checksum"}))
+
+    def test_append_jsonl_log_event_accepts_precomputed_details(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            cfg = AdaadConfig(home=tmpdir, log_path="events.jsonl")
+            details = {"b": [1, 2], "a": "é"}
+            plain = append_jsonl_log_event(cfg=cfg, action="run", outcome="ok", details=details, ts="2024-01-01T00:00:00Z")
+            spliced = append_jsonl_log_event(
+                cfg=cfg,
+                action="run",
+                outcome="ok",
+                details=details,
+                ts="2024-01-01T00:00:00Z",
+                details_canonical=canonical_json_bytes(details),
+            )
+
+            self.assertEqual(plain, spliced)
+            first, second = log_path(cfg).read_text(encoding="utf-8").splitlines()
+            self.assertEqual(first, second)
 
     def test_log_path_resolves_under_home_and_appends_lines(self) -> None:
         with TemporaryDirectory() as tmpdir:
@@ -49,6 +84,120 @@ class AssuranceLoggingTest(unittest.TestCase):
                 self.assertEqual(loaded["schema_version"], cfg.log_schema_version)
                 self.assertIn("checksum", loaded)
 
+    def test_log_path_tracks_home_changes(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "first").mkdir()
+            (root / "second").mkdir()
+            cfg = AdaadConfig(home="~/ws", log_path="events.jsonl")
+            with patch.dict(os.environ, {"HOME": str(root / "first")}):
+                self.assertEqual((root / "first").resolve() / "ws" / "events.jsonl", log_path(cfg))
+            with patch.dict(os.environ, {"HOME": str(root / "second")}):
+                self.assertEqual((root / "second").resolve() / "ws" / "events.jsonl", log_path(cfg))
+
+    def test_append_reopens_log_after_rotation(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            cfg = AdaadConfig(home=tmpdir, log_path="events.jsonl")
+            path = log_path(cfg)
+            append_jsonl_log_event(cfg=cfg, action="a", outcome="ok", ts="2024-01-01T00:00:00Z")
+            path.rename(path.with_suffix(".1"))
+            append_jsonl_log_event(cfg=cfg, action="b", outcome="ok", ts="2024-01-01T00:00:01Z")
+            append_jsonl_log_event(cfg=cfg, action="c", outcome="ok", ts="2024-01-01T00:00:02Z")
+            flush_log(path)
+            flush_log()
+
+            rotated = path.with_suffix(".1").read_text(encoding="utf-8").splitlines()
+            current = path.read_text(encoding="utf-8").splitlines()
+            self.assertEqual([json.loads(line)["action"] for line in rotated], ["a"])
+            self.assertEqual([json.loads(line)["action"] for line in current], ["b", "c"])
+
+    def test_concurrent_appends_past_the_descriptor_cap_stay_in_their_files(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            cfg = AdaadConfig(home=tmpdir)
+            paths = [Path(tmpdir) / f"log{idx}.jsonl" for idx in range(12)]
+
+            def writer(offset: int) -> None:
+                for step in range(60):
+                    idx = (offset + step) % len(paths)
+                    append_jsonl_log_event(cfg=cfg, action=f"log{idx}", outcome="ok", ts="2024-01-01T00:00:00Z", path=paths[idx])
+
+            threads = [threading.Thread(target=writer, args=(offset,)) for offset in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            total = 0
+            for idx, path in enumerate(paths):
+                actions = [json.loads(line)["action"] for line in path.read_text(encoding="utf-8").splitlines()]
+                self.assertEqual({f"log{idx}"}, set(actions))
+                total += len(actions)
+            self.assertEqual(4 * 60, total)
+
+    def test_build_log_event_caches_canonical_bytes(self) -> None:
+        event = build_log_event(
+            schema_version="1",
+            ts="2024-01-01T00:00:00Z",
+            actor="tester",
+            intent="echo",
+            inputs={"z": [1, 2.5, None], "a": "\u00e9"},
+            outputs={"ok": True},
+        )
+        self.assertEqual(event.canonical, canonical_json(event.to_dict()).encode("utf-8"))
+        payload = {k: v for k, v in event.to_dict().items() if k != "checksum"}
+        self.assertEqual(event.checksum, compute_checksum(payload))
+        self.assertIs(event.to_dict(), event.to_dict())
+
+    def test_canonical_json_splice_matches_canonical_json(self) -> None:
+        nested = {"b": [1, {"y": 2, "x": 1}], "a": "\u00e9"}
+        fields = {"z": None, "m": 1.5, "a": "text"}
+        spliced = canonical_json_splice(fields, {"n": canonical_json(nested).encode("utf-8")})
+        self.assertEqual(spliced, canonical_json({**fields, "n": nested}).encode("utf-8"))
+
+    def test_canonical_json_bytes_matches_stdlib_encoding(self) -> None:
+        samples = [
+            {"b": 1, "a": [True, False, None]},
+            {"hash": "3e5f00aa", "text": "true 1e5 0.00001 null"},
+            {"floats": [0.1, 1.5, 1e16, 1e-05, 2.5e-07, -0.0]},
+            {"nan": float("nan"), "inf": float("inf")},
+            {"unicode": "\u00e9\u2603", "ctrl": "\x00\x1f\x7f", "quote": 'a"b\\c'},
+            {"quoted": 'say "null" 1e5 \\', "n": 3},
+            {"quoted": 'say "null"', "f": 1e16},
+            {"big": 10**20},
+            {2: "int keys", 1: "sorted"},
+            ("tuple", 1),
+        ]
+        for sample in samples:
+            expected = json.dumps(sample, sort_keys=True, separators=(",", ":")).encode("utf-8")
+            self.assertEqual(canonical_json_bytes(sample), expected)
+            self.assertEqual(canonical_json_line(sample), expected + b"\n")
+
+        class Plain(Enum):
+            A = 1
+
+        class Label(str, Enum):
+            A = "a"
+
+        self.assertEqual(canonical_json_bytes({"label": Label.A, "n": IntEnum("N", "ONE").ONE}), b'{"label":"a","n":1}')
+        for unsupported in (Plain.A, {"k": Plain.A}, [uuid.UUID(int=1)], {"when": datetime(2026, 1, 1)}):
+            with self.assertRaises(TypeError):
+                json.dumps(unsupported)
+            with self.assertRaises(TypeError):
+                canonical_json_bytes(unsupported)
+            with self.assertRaises(TypeError):
+                canonical_json_line(unsupported)
+
+    def test_parse_json_matches_stdlib_loads(self) -> None:
+        samples = ['{"a": [1, 2.5, null, true]}', '{"big": 100000000000000000000}', '{"a": NaN}', '"\\ud800"']
+        for raw in samples:
+            expected = json.loads(raw)
+            actual = parse_json(raw)
+            self.assertEqual(repr(actual), repr(expected))
+            self.assertEqual(type(actual), type(expected))
+            self.assertEqual(repr(parse_json(raw.encode("utf-8"))), repr(expected))
+        with self.assertRaises(json.JSONDecodeError):
+            parse_json("{not json")
+
 
 if __name__ == "__main__":
     unittest.main()
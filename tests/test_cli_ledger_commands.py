@@ -6,7 +6,7 @@ from tempfile import TemporaryDirectory
 from unittest.mock import patch
 
 from adaad6.config import AdaadConfig
-from adaad6.provenance.ledger import append_event
+from adaad6.provenance.ledger import append_event, read_events
 
 
 class CliLedgerCommandsTest(unittest.TestCase):
@@ -50,6 +50,15 @@ class CliLedgerCommandsTest(unittest.TestCase):
             self.assertTrue(summary["valid"])
             self.assertEqual(summary["count"], 2)
 
+    def test_batched_run_writes_its_event_before_returning(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            cfg = AdaadConfig(home=tmpdir, ledger_enabled=True, ledger_batch_size=8, cli_logging_enabled=False)
+
+            for n in (1, 2):
+                exit_code, _ = self._run_cli(["run", "--intent", "echo", "--inputs", json.dumps({"n": n})], cfg)
+                self.assertEqual(exit_code, 0)
+                self.assertEqual(n, len(read_events(cfg)))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -27,6 +27,21 @@ class CliLoggingBestEffortTest(unittest.TestCase):
             exit_code = main(["health"])
             self.assertEqual(exit_code, 0)
 
+    def test_logging_disabled_skips_append(self) -> None:
+        fake_config = DummyConfig()
+        fake_config.cli_logging_enabled = False
+        with (
+            patch("adaad6.config.load_config", return_value=fake_config),
+            patch("adaad6.assurance.logging.append_jsonl_log_event") as append_mock,
+            patch("adaad6.runtime.health.check_structure_details") as check_structure_details,
+        ):
+            check_structure_details.return_value = {"structure": {"ok": True}, "ledger_dirs": {"ok": True}}
+
+            from adaad6.cli import main
+
+            self.assertEqual(main(["health"]), 0)
+            append_mock.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,6 @@
 import json
 import unittest
-from contextlib import redirect_stdout
+from contextlib import redirect_stderr, redirect_stdout
 from io import StringIO
 from unittest.mock import patch
 
@@ -65,5 +65,31 @@ class CliTemplatesTest(unittest.TestCase):
         self.assertEqual(["ledger_step_complete"], template["steps"][3]["effects"])
 
 
+    def test_parser_only_populates_selected_subcommand(self) -> None:
+        from adaad6.cli import _build_parser, _selected_command
+
+        self.assertEqual("template", _selected_command(["template", "scaffold"]))
+        self.assertIsNone(_selected_command(["--help"]))
+        self.assertIsNone(_selected_command(["unknown"]))
+
+        args = _build_parser("template").parse_args(["template", "scaffold", "--destination", "out.md"])
+        self.assertEqual(("scaffold", "out.md", "HEAD"), (args.name, args.destination, args.base_ref))
+        with redirect_stderr(StringIO()), self.assertRaises(SystemExit):
+            _build_parser("plan").parse_args(["template", "scaffold"])
+
+
+    def test_parser_is_reused_across_main_calls(self) -> None:
+        from adaad6.cli import _build_parser, main
+
+        with patch("adaad6.config.load_config", return_value=DummyConfig()):
+            with redirect_stdout(StringIO()):
+                main(["template", "scaffold"])
+                hits = _build_parser.cache_info().hits
+                main(["template", "diff_report"])
+
+        self.assertEqual(hits + 1, _build_parser.cache_info().hits)
+        self.assertIs(_build_parser("template"), _build_parser("template"))
+
+
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
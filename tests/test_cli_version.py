@@ -0,0 +1,41 @@
+import io
+import json
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from unittest.mock import patch
+
+from adaad6.config import CONFIG_SCHEMA_VERSION
+
+
+class CliVersionTest(unittest.TestCase):
+    def test_version_does_not_load_config(self) -> None:
+        with patch("adaad6.config.load_config", side_effect=AssertionError("config loaded")) as load_mock:
+            from adaad6.cli import main
+
+            out = StringIO()
+            with redirect_stdout(out):
+                exit_code = main(["version"])
+
+        self.assertEqual(0, exit_code)
+        load_mock.assert_not_called()
+        payload = json.loads(out.getvalue())
+        self.assertTrue(payload["ok"])
+        self.assertEqual(CONFIG_SCHEMA_VERSION, payload["config_schema_version"])
+
+    def test_pending_text_output_precedes_emitted_json(self) -> None:
+        from adaad6.cli import main
+
+        raw = io.BytesIO()
+        stream = io.TextIOWrapper(raw, encoding="utf-8")
+        stream.write("before\n")
+        with redirect_stdout(stream):
+            self.assertEqual(0, main(["version"]))
+
+        first, second = raw.getvalue().splitlines()
+        self.assertEqual(b"before", first)
+        self.assertTrue(json.loads(second)["ok"])
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
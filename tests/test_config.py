@@ -1,9 +1,26 @@
+import hashlib
+import hmac
+import os
+import tempfile
 import unittest
+from pathlib import Path
+from unittest.mock import patch
 
 from adaad6.config import (
     AdaadConfig,
     MutationPolicy,
+    ResourceTier,
     RunMode,
+    _canonical_env_payload,
+    _check_relative_safe,
+    _coerce_bool,
+    _coerce_enum,
+    _dev_env_key_provider,
+    _env_view,
+    _get_env,
+    _resolve_home,
+    _traverses_symlink,
+    _verify_env_signature,
     enforce_readiness_gate,
     load_config,
     verify_readiness_gate_signature,
@@ -28,6 +45,187 @@ class ConfigTest(unittest.TestCase):
         cfg = load_config({"ADAAD6_LEDGER_SCHEMA_VERSION": "9"})
         self.assertEqual(cfg.ledger_schema_version, "9")
 
+    def test_ledger_batch_size_env_and_bounds(self) -> None:
+        cfg = load_config({"ADAAD6_CONFIG_SIG_REQUIRED": "false", "ADAAD6_LEDGER_BATCH_SIZE": "16"})
+        self.assertEqual(cfg.ledger_batch_size, 16)
+        with self.assertRaises(ValueError):
+            AdaadConfig(ledger_batch_size=0).validate()
+
+    def test_planner_seconds_clamped_even_without_tier_scaling(self) -> None:
+        base = {"ADAAD6_CONFIG_SIG_REQUIRED": "false", "ADAAD6_RESOURCE_TIER": "server"}
+        cfg = load_config({**base, "ADAAD6_PLANNER_MAX_SECONDS": "1000"})
+        self.assertEqual(1.0, cfg.resource_scaling)
+        self.assertEqual(300.0, cfg.planner_max_seconds)
+        self.assertEqual(0.01, load_config({**base, "ADAAD6_PLANNER_MAX_SECONDS": "0"}).planner_max_seconds)
+
+    def test_validate_rejects_field_errors_before_touching_the_filesystem(self) -> None:
+        with patch("adaad6.config._enforce_log_path_sandbox") as sandbox_mock:
+            with self.assertRaisesRegex(ValueError, "planner_max_steps"):
+                AdaadConfig(planner_max_steps=0).validate()
+            with self.assertRaisesRegex(ValueError, "emergency_halt requires"):
+                AdaadConfig(emergency_halt=True).validate()
+        sandbox_mock.assert_not_called()
+
+    def test_validate_once_skips_after_first_success(self) -> None:
+        cfg = AdaadConfig()
+        with patch("adaad6.config._enforce_log_path_sandbox") as sandbox_mock:
+            cfg.validate_once()
+            cfg.validate_once()
+            self.assertEqual(sandbox_mock.call_count, 1)
+            cfg.validate()
+            self.assertEqual(sandbox_mock.call_count, 2)
+        self.assertEqual(cfg, AdaadConfig())
+
+    def test_canonical_env_payload_sorts_by_key_and_skips_signatures(self) -> None:
+        env = {
+            "ADAAD6_\u00e9": "accent",
+            "ADAAD6_Z": "z",
+            "ADAAD6_A": "caf\u00e9",
+            "ADAAD6_CONFIG_SIG": "ignored",
+            "ADAAD6_SKIP": "extra",
+            "OTHER": "ignored",
+        }
+        payload = _canonical_env_payload(env, extra_excluded=["ADAAD6_SKIP"])
+        self.assertEqual(payload, "ADAAD6_A=caf\u00e9\nADAAD6_Z=z\nADAAD6_\u00e9=accent\n".encode("utf-8"))
+
+    def test_traverses_symlink_checks_each_existing_component(self) -> None:
+        if not hasattr(os, "symlink"):
+            self.skipTest("os.symlink not available on this platform")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base = Path(tmpdir)
+            (base / "real").mkdir()
+            try:
+                os.symlink(str(base / "real"), str(base / "link"), target_is_directory=True)
+                os.symlink(str(base / "missing"), str(base / "dangling"))
+            except (OSError, NotImplementedError):
+                self.skipTest("symlink creation not permitted")
+
+            self.assertFalse(_traverses_symlink(base, ("real", "ledger")))
+            self.assertFalse(_traverses_symlink(base, ("absent", "ledger")))
+            self.assertFalse(_traverses_symlink(base, ("dangling", "ledger")))
+            self.assertTrue(_traverses_symlink(base, ("link", "ledger")))
+
+    def test_coerce_bool_accepts_any_casing_and_padding(self) -> None:
+        for raw in ("true", "TRUE", "Yes", " on ", "tRuE", "1"):
+            self.assertTrue(_coerce_bool(raw))
+        for raw in ("false", "No", "OFF", "\t0\n", "fAlSe"):
+            self.assertFalse(_coerce_bool(raw))
+        with self.assertRaisesRegex(ValueError, "Invalid boolean value: maybe"):
+            _coerce_bool("maybe")
+
+    def test_env_view_matches_prefixed_lookup(self) -> None:
+        env = {
+            "ADAAD6_MODE": "prod",
+            "MODE": "dev",
+            "ADAAD6_LOG_PATH": "",
+            "LOG_PATH": "bare.jsonl",
+            "ADAAD6_ACTIONS_DIR": "",
+            "HOME": "/home/x",
+        }
+        view = _env_view(env)
+        for key in ("MODE", "LOG_PATH", "ACTIONS_DIR", "HOME", "MISSING"):
+            self.assertEqual(_get_env(env, key), view.get(key))
+
+    def test_resolve_home_follows_a_retargeted_symlink(self) -> None:
+        if not hasattr(os, "symlink"):
+            self.skipTest("os.symlink not available on this platform")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "first").mkdir()
+            (root / "second").mkdir()
+            link = root / "home"
+            try:
+                os.symlink(str(root / "first"), str(link), target_is_directory=True)
+            except (OSError, NotImplementedError):
+                self.skipTest("symlink creation not permitted")
+            env = {"ADAAD6_HOME": str(link)}
+            self.assertEqual((root / "first").resolve(), _resolve_home(env))
+
+            link.unlink()
+            os.symlink(str(root / "second"), str(link), target_is_directory=True)
+            self.assertEqual((root / "second").resolve(), _resolve_home(env))
+
+    def test_coerce_enum_normalizes_and_lists_allowed_values(self) -> None:
+        self.assertIs(ResourceTier.EDGE, _coerce_enum(" Edge ", ResourceTier, "resource_tier"))
+        self.assertIs(RunMode.PROD, _coerce_enum("PROD", RunMode, "mode"))
+        with self.assertRaisesRegex(ValueError, "Invalid mode: staging. Allowed: dev, prod"):
+            _coerce_enum("staging", RunMode, "mode")
+
+    def test_env_signature_rejects_missing_sig_before_asking_for_key(self) -> None:
+        provider_calls = []
+
+        def provider(source):
+            provider_calls.append(source)
+            return "key"
+
+        env = {"ADAAD6_CONFIG_SIG_ALG": " hmac-sha256 ", "ADAAD6_CONFIG_SCHEMA_VERSION": "1"}
+        self.assertFalse(_verify_env_signature(env, mode=RunMode.DEV, key_provider=provider))
+        self.assertEqual([], provider_calls)
+
+    def test_check_relative_safe_covers_posix_and_windows_separators(self) -> None:
+        for raw in ("logs/a.jsonl", "a\\b", "a..b/c", "./x", ""):
+            _check_relative_safe(raw, "log_path")
+        cases = {
+            "/abs": "relative path",
+            "C:rel": "relative path",
+            "\\\\server\\share\\x": "relative path",
+            "\\rooted": "relative path",
+            "~/x": "start with ~",
+            "a/../b": "traversal",
+            "a\\..\\b": "traversal",
+        }
+        for raw, message in cases.items():
+            with self.assertRaisesRegex(ValueError, f"^log_path must .*{message}"):
+                _check_relative_safe(raw, "log_path")
+
+    def test_env_signature_rejects_malformed_sig_before_key_or_mac(self) -> None:
+        env = {
+            "ADAAD6_CONFIG_SIG_ALG": "HMAC-SHA256",
+            "ADAAD6_CONFIG_SCHEMA_VERSION": "1",
+            "ADAAD6_CONFIG_SIG_KEY": "dev-key",
+            "ADAAD6_LEDGER_ENABLED": "false",
+        }
+        env["ADAAD6_CONFIG_SIG"] = hmac.new(b"dev-key", _canonical_env_payload(env), hashlib.sha256).hexdigest()
+
+        self.assertTrue(_verify_env_signature(env, mode=RunMode.DEV, key_provider=_dev_env_key_provider))
+
+        provider_calls = []
+
+        def provider(source):
+            provider_calls.append(source)
+            return "dev-key"
+
+        with patch("adaad6.config._hmac_sha256", side_effect=AssertionError("MAC computed")):
+            for bad in ("abc", "zz" * 32, env["ADAAD6_CONFIG_SIG"] + "00"):
+                malformed = dict(env, ADAAD6_CONFIG_SIG=bad)
+                self.assertFalse(_verify_env_signature(malformed, mode=RunMode.DEV, key_provider=provider))
+        self.assertEqual([], provider_calls)
+
+        spaced = dict(env, ADAAD6_CONFIG_SIG=" ".join(env["ADAAD6_CONFIG_SIG"][i : i + 2] for i in range(0, 64, 2)))
+        self.assertFalse(_verify_env_signature(spaced, mode=RunMode.DEV, key_provider=_dev_env_key_provider))
+        upper = dict(env, ADAAD6_CONFIG_SIG=f" {env['ADAAD6_CONFIG_SIG'].upper()} ")
+        self.assertTrue(_verify_env_signature(upper, mode=RunMode.DEV, key_provider=_dev_env_key_provider))
+
+        tampered = dict(env, ADAAD6_LEDGER_ENABLED="true")
+        self.assertFalse(_verify_env_signature(tampered, mode=RunMode.DEV, key_provider=_dev_env_key_provider))
+
+    def test_load_config_rechecks_sandbox_on_every_load(self) -> None:
+        if not hasattr(os, "symlink"):
+            self.skipTest("os.symlink not available on this platform")
+        with tempfile.TemporaryDirectory() as tmpdir, tempfile.TemporaryDirectory() as outside:
+            home = Path(tmpdir)
+            (home / "logs").mkdir()
+            env = {"ADAAD6_HOME": str(home), "ADAAD6_LOG_PATH": "logs/adaad6.jsonl"}
+            self.assertEqual("logs/adaad6.jsonl", load_config(env).log_path)
+
+            (home / "logs").rmdir()
+            try:
+                os.symlink(outside, str(home / "logs"), target_is_directory=True)
+            except (OSError, NotImplementedError):
+                self.skipTest("symlink creation not permitted")
+            with self.assertRaises(ValueError):
+                load_config(env)
+
     def test_ledger_file_attribute_alias(self) -> None:
         cfg = AdaadConfig(ledger_enabled=True, ledger_dir=".adaad/ledger", ledger_file="events.jsonl")
         self.assertEqual(cfg.ledger_file, "events.jsonl")
@@ -58,6 +256,12 @@ class ConfigTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             AdaadConfig(ledger_enabled=True, ledger_schema_version="").validate()
 
+    def test_config_schema_version_tolerates_padding_only(self) -> None:
+        AdaadConfig(config_schema_version=" 1 ").validate()
+        for bad in ("", "2", None):
+            with self.assertRaises(ValueError):
+                AdaadConfig(config_schema_version=bad).validate()
+
     def test_log_path_env_override(self) -> None:
         cfg = load_config({"ADAAD6_LOG_PATH": "custom/logs.jsonl"})
         self.assertEqual(cfg.log_path, "custom/logs.jsonl")
@@ -71,6 +275,9 @@ class ConfigTest(unittest.TestCase):
             AdaadConfig(log_path="/tmp/out.jsonl").validate()
         with self.assertRaises(ValueError):
             AdaadConfig(home="/home/user", log_path="../evil").validate()
+        for windows_path in ("C:\\logs\\out.jsonl", "D:out.jsonl", "logs\\..\\..\\evil", "\\\\server\\share\\out.jsonl"):
+            with self.assertRaises(ValueError):
+                AdaadConfig(log_path=windows_path).validate()
 
     def test_actions_dir_env_override(self) -> None:
         cfg = load_config({"ADAAD6_ACTIONS_DIR": "custom/actions"})
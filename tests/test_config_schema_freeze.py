@@ -1,6 +1,6 @@
 import unittest
 
-from adaad6.config import load_config
+from adaad6.config import ResourceTier, load_config
 
 
 class ConfigSchemaFreezeTest(unittest.TestCase):
@@ -14,6 +14,31 @@ class ConfigSchemaFreezeTest(unittest.TestCase):
         self.assertTrue(cfg.emergency_halt)
         self.assertEqual(cfg.freeze_reason, "CONFIG_SCHEMA_VERSION_MISMATCH")
 
+    def test_schema_mismatch_skips_signature_verification(self) -> None:
+        provider_calls = []
+
+        def provider(source):
+            provider_calls.append(source)
+            return "key"
+
+        cfg = load_config(
+            env={"ADAAD6_CONFIG_SCHEMA_VERSION": "0", "ADAAD6_CONFIG_SIG": "00"},
+            key_provider=provider,
+        )
+
+        self.assertEqual(cfg.freeze_reason, "CONFIG_SCHEMA_VERSION_MISMATCH")
+        self.assertEqual([], provider_calls)
+
+    def test_frozen_config_keeps_resource_tier_scaling(self) -> None:
+        env = {
+            "ADAAD6_CONFIG_SCHEMA_VERSION": "0",
+            "ADAAD6_RESOURCE_TIER": "edge",
+        }
+        cfg = load_config(env=env)
+
+        self.assertEqual(cfg.resource_tier, ResourceTier.EDGE)
+        self.assertEqual(cfg.resource_scaling, 1.5)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -3,7 +3,7 @@ import unittest
 from pathlib import Path
 from unittest.mock import patch
 
-from adaad6.assurance.doctor import run_doctor
+from adaad6.assurance.doctor import FORBIDDEN_MODULES, _scan_forbidden_modules, run_doctor
 from adaad6.config import AdaadConfig, ResourceTier
 from adaad6.provenance.ledger import read_events
 
@@ -38,7 +38,8 @@ class DoctorTest(unittest.TestCase):
 
             report = run_doctor(cfg=cfg)
 
-            ensure_ledger_mock.assert_called_once()
+            ensure_ledger_mock.assert_not_called()
+            self.assertEqual(str(ledger_path.resolve()), report["checks"]["ledger"]["path"])
             append_event_mock.assert_called_once()
             args, kwargs = append_event_mock.call_args
             self.assertEqual(cfg, kwargs["cfg"])
@@ -73,6 +74,36 @@ class DoctorTest(unittest.TestCase):
             self.assertEqual(cfg.resource_tier.value, static_scan["tier"])
             _run_pytest_mock.assert_called_once_with(cfg)
 
+    def test_parallel_static_scan_matches_serial_scan(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            for idx in range(40):
+                package = root / f"pkg{idx % 3}"
+                package.mkdir(exist_ok=True)
+                body = "import socket\n" if idx % 7 == 0 else "import os\n"
+                (package / f"mod{idx}.py").write_text(body, encoding="utf-8")
+            (root / "broken.py").write_text("from socket import (\n", encoding="utf-8")
+
+            serial = _scan_forbidden_modules(root, FORBIDDEN_MODULES)
+            with patch("adaad6.assurance.doctor.os.cpu_count", return_value=2):
+                parallel = _scan_forbidden_modules(root, FORBIDDEN_MODULES, parallel=True)
+
+            self.assertEqual(serial, parallel)
+            self.assertEqual(len(serial[1]), 41)
+            self.assertIn({"path": "broken.py", "module": "socket"}, serial[0])
+
+    def test_static_scan_matches_whole_module_names(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "near_miss.py").write_text("import socketserver\nfrom x import websocket\n", encoding="utf-8")
+            (root / "latin.py").write_bytes(b"# -*- coding: latin-1 -*-\nimport socket\nname = '\xe9'\n")
+
+            hits, scanned, errors = _scan_forbidden_modules(root, FORBIDDEN_MODULES)
+
+            self.assertEqual(scanned, ["latin.py", "near_miss.py"])
+            self.assertEqual(hits, [{"path": "latin.py", "module": "socket"}])
+            self.assertEqual(errors, [])
+
     @patch("adaad6.assurance.doctor._run_pytest_check", autospec=True, return_value={"ok": True})
     def test_run_doctor_appends_event_to_ledger(self, _run_pytest_mock) -> None:
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -61,3 +61,15 @@ def test_map_exception_can_attach_debug_to_kernel_crash() -> None:
     assert mapped.code == INTEGRITY_VIOLATION
     assert mapped.detail == "x"
     assert mapped.debug_detail is not None
+
+
+def test_map_exception_keeps_group_precedence_for_mixed_subclasses() -> None:
+    class MissingAndInvalid(KeyError, ValueError):
+        pass
+
+    class SlowLookup(TimeoutError, LookupError):
+        pass
+
+    assert map_exception(MissingAndInvalid("k")).code == INTEGRITY_VIOLATION
+    assert map_exception(SlowLookup("t")).code == DETERMINISM_BREACH
+    assert map_exception(UnicodeDecodeError("utf-8", b"\xff", 0, 1, "bad")).code == INTEGRITY_VIOLATION
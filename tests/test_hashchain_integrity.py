@@ -3,7 +3,8 @@ import unittest
 from tempfile import TemporaryDirectory
 
 from adaad6.config import AdaadConfig
-from adaad6.provenance import append_event, read_events, verify_chain
+from adaad6.assurance.logging import canonical_json_bytes
+from adaad6.provenance import append_event, compute_event_hash, read_events, verify_chain
 
 
 class HashchainIntegrityTest(unittest.TestCase):
@@ -32,6 +33,15 @@ class HashchainIntegrityTest(unittest.TestCase):
 
             self.assertFalse(verify_chain(broken))
 
+    def test_spliced_event_hash_matches_plain_hash(self) -> None:
+        fields = {"type": "alpha", "prev_hash": None, "ts": "2024-01-01T00:00:00Z"}
+        payload = {"value": [1, "\u00e9"], "nested": {"b": 2, "a": None}}
+
+        self.assertEqual(
+            compute_event_hash(dict(fields, payload=payload)),
+            compute_event_hash(fields, {"payload": canonical_json_bytes(payload)}),
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
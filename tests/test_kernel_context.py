@@ -1,7 +1,7 @@
 import os
 import json
 import unittest
-from dataclasses import asdict
+from dataclasses import asdict, replace
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
@@ -65,6 +65,23 @@ class KernelContextTest(unittest.TestCase):
         snapshot = ConfigSnapshot.from_config(cfg)
         self.assertEqual(snapshot.hash, hash_object(asdict(cfg)))
 
+        exports_cfg = AdaadConfig(home="/tmp", telemetry_exports=("telemetry/metrics.jsonl",))
+        exports_snapshot = ConfigSnapshot.from_config(exports_cfg)
+        self.assertEqual(dict(exports_snapshot.values), asdict(exports_cfg))
+        self.assertEqual(exports_snapshot.hash, hash_object(asdict(exports_cfg)))
+
+    def test_config_snapshot_is_computed_once_per_config(self) -> None:
+        cfg = AdaadConfig(planner_max_seconds=5)
+        snapshot = ConfigSnapshot.from_config(cfg)
+
+        self.assertIs(snapshot, ConfigSnapshot.from_config(cfg))
+        self.assertIs(snapshot, KernelContext.build(cfg).config)
+        # equal configs whose values serialize differently keep their own hash
+        float_cfg = replace(cfg, planner_max_seconds=5.0)
+        self.assertEqual(cfg, float_cfg)
+        self.assertNotEqual(snapshot.hash, ConfigSnapshot.from_config(float_cfg).hash)
+        self.assertEqual(ConfigSnapshot.from_config(float_cfg).hash, hash_object(asdict(float_cfg)))
+
     def test_artifact_registry_is_immutable(self) -> None:
         registry = ArtifactRegistry()
         updated = registry.register("plan", "/tmp/plan.json")
@@ -74,6 +91,19 @@ class KernelContextTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             updated.register("plan", "/tmp/plan.json")
 
+    def test_artifact_registry_rejects_duplicates_from_constructor_tuple(self) -> None:
+        registry = ArtifactRegistry(artifacts=(("plan", "/tmp/plan.json"),))
+
+        with self.assertRaises(ValueError):
+            registry.register("plan", "/tmp/other.json")
+        updated = registry.register("log", "/tmp/log.jsonl").register("trace", "/tmp/trace.json")
+        with self.assertRaises(ValueError):
+            updated.register("log", "/tmp/log.jsonl")
+        self.assertEqual(
+            ArtifactRegistry(artifacts=(("plan", "/tmp/plan.json"), ("log", "/tmp/log.jsonl"), ("trace", "/tmp/trace.json"))),
+            updated,
+        )
+
     def test_kernel_context_serializes_for_ledger_logging(self) -> None:
         cfg = AdaadConfig()
         ctx = KernelContext.build(cfg, run_id="run-1").register_artifact("log", "/tmp/log.jsonl")
@@ -96,5 +96,15 @@ class PlannerGoldenTest(unittest.TestCase):
         self.assertEqual(len(timed_dict["steps"]), 1)
 
 
+    def test_validated_config_skips_sandbox_rechecks(self) -> None:
+        cfg = AdaadConfig()
+        cfg.validate()
+
+        with patch("adaad6.config._enforce_log_path_sandbox") as sandbox_mock:
+            make_plan("Deliver a minimal credible plan", cfg)
+            make_plan("Deliver a minimal credible plan", cfg)
+
+        sandbox_mock.assert_not_called()
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,13 @@
+import errno
+import io
+import os
 import unittest
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
 
 from adaad6.config import AdaadConfig
-from adaad6.provenance import ensure_ledger
+from adaad6.provenance import LedgerBatchWriter, LedgerWriteError, ensure_ledger, read_events, verify_chain
+from adaad6.provenance.ledger import _flush_live_writers
 
 
 class ProvenanceLedgerTest(unittest.TestCase):
@@ -10,6 +16,89 @@ class ProvenanceLedgerTest(unittest.TestCase):
         with self.assertRaises(RuntimeError):
             ensure_ledger(cfg)
 
+    def test_batch_writer_flushes_on_size_and_chains_events(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            cfg = AdaadConfig(home=tmpdir, ledger_enabled=True)
+            writer = LedgerBatchWriter(cfg, max_events=3, max_delay_s=60.0)
+            self.assertEqual(writer.enqueue("e", {"n": 0}, "t0", "tester"), [])
+            self.assertEqual(writer.enqueue("e", {"n": 1}, "t1", "tester"), [])
+            self.assertEqual(read_events(cfg), [])
+
+            written = writer.enqueue("e", {"n": 2}, "t2", "tester")
+            self.assertEqual([event["payload"]["n"] for event in written], [0, 1, 2])
+            self.assertEqual(writer.pending, 0)
+
+            with writer:
+                writer.enqueue("e", {"n": 3}, "t3", "tester")
+            events = read_events(cfg)
+            self.assertEqual(len(events), 4)
+            self.assertTrue(verify_chain(events))
+
+    def test_batch_writer_flushes_when_oldest_entry_ages_out(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            cfg = AdaadConfig(home=tmpdir, ledger_enabled=True)
+            now = [0.0]
+            writer = LedgerBatchWriter(cfg, max_events=100, max_delay_s=0.005, clock=lambda: now[0])
+            self.assertEqual(writer.enqueue("e", {"n": 0}, "t0", "tester"), [])
+            now[0] = 0.01
+            self.assertEqual(len(writer.enqueue("e", {"n": 1}, "t1", "tester")), 2)
+
+    @unittest.skipUnless(os.name == "posix", "partial appends are detected on POSIX")
+    def test_partial_flush_failure_keeps_only_unwritten_entries(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            cfg = AdaadConfig(home=tmpdir, ledger_enabled=True)
+            writer = LedgerBatchWriter(cfg, max_events=100, max_delay_s=60.0)
+            for n in range(3):
+                writer.enqueue("e", {"n": n}, f"t{n}", "tester")
+            real_write = os.write
+            calls = []
+
+            def write_one_line_then_fail(fd, data):
+                calls.append(fd)
+                if len(calls) > 1:
+                    raise OSError(errno.ENOSPC, "No space left on device")
+                chunk = bytes(data)
+                return real_write(fd, chunk[: chunk.index(b"\n") + 1])
+
+            with patch("adaad6.assurance.logging.os.write", side_effect=write_one_line_then_fail):
+                with self.assertRaises(LedgerWriteError) as ctx:
+                    writer.flush()
+            self.assertEqual([0], [event["payload"]["n"] for event in ctx.exception.written])
+            self.assertEqual(2, writer.pending)
+
+            writer.flush()
+            events = read_events(cfg)
+            self.assertEqual([0, 1, 2], [event["payload"]["n"] for event in events])
+            self.assertTrue(verify_chain(events))
+
+    def test_pending_entries_are_flushed_at_exit(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            cfg = AdaadConfig(home=tmpdir, ledger_enabled=True)
+            writer = LedgerBatchWriter(cfg, max_events=100, max_delay_s=60.0)
+            writer.enqueue("e", {"n": 0}, "t0", "tester")
+            _flush_live_writers()
+            self.assertEqual(1, len(read_events(cfg)))
+            self.assertEqual(0, writer.pending)
+
+    def test_exit_flush_failure_is_reported_on_stderr(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            cfg = AdaadConfig(home=tmpdir, ledger_enabled=True)
+            writer = LedgerBatchWriter(cfg, max_events=100, max_delay_s=60.0)
+            writer.enqueue("e", {"n": 0}, "t0", "tester")
+            stderr = io.StringIO()
+            with patch("adaad6.provenance.ledger.append_events", side_effect=OSError("disk gone")):
+                with patch("sys.stderr", stderr):
+                    _flush_live_writers()
+            self.assertIn("failed to flush 1 pending ledger events: disk gone", stderr.getvalue())
+            self.assertEqual(1, writer.pending)
+            writer.flush()
+
+    def test_batch_writer_rejects_readonly_ledger(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            cfg = AdaadConfig(home=tmpdir, ledger_enabled=True, ledger_readonly=True)
+            with self.assertRaises(RuntimeError):
+                LedgerBatchWriter(cfg).enqueue("e", {}, "t0", "tester")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -14,6 +14,7 @@ class RuntimeHealthTest(unittest.TestCase):
         self.assertTrue(result["ledger_dirs"])
         self.assertTrue(result["tree_law"])
         self.assertTrue(check_structure(cfg=AdaadConfig(ledger_enabled=False)))
+        self.assertEqual(list(result), sorted(result))
 
     def test_ledger_dirs_missing_but_creatable(self) -> None:
         with tempfile.TemporaryDirectory() as tmpdir: